@@ -5,4 +5,4 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
     def ready(self):
-        import accounts.signals
\ No newline at end of file
+        import accounts.signals
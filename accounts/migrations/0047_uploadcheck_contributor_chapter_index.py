@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0046_studentprofile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='uploadcheck',
+            index=models.Index(fields=['contributor', 'chapter'], name='upload_contrib_chapter_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0047_uploadcheck_contributor_chapter_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DriveFolderCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('parent_id', models.CharField(blank=True, default='', max_length=128)),
+                ('drive_id', models.CharField(blank=True, default='', max_length=128)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('name', 'parent_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-16 12:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0048_drivefoldercache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssessmentJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('response', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('contributor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assessment_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-16 12:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0049_assessmentjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseEmbedding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=100)),
+                ('text_hash', models.CharField(max_length=40)),
+                ('vector', models.BinaryField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='embedding', to='accounts.course')),
+            ],
+        ),
+    ]
@@ -1,4 +1,5 @@
 # OER/accounts/models.py
+import uuid
 
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
@@ -250,6 +251,12 @@ class UploadCheck(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
     evaluation_status = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # "has this contributor submitted this chapter?" lookups
+            models.Index(fields=["contributor", "chapter"], name="upload_contrib_chapter_idx"),
+        ]
+
     def __str__(self):
         return f"Upload by {self.contributor.username} for {self.chapter.chapter_name} at {self.timestamp}"
 
@@ -405,6 +412,21 @@ class Option(models.Model):
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='options')
     text = models.CharField(max_length=255)
 
+class AssessmentJob(models.Model):
+    """
+    One background generate_assessment run. status_code stays null while
+    the job runs; then it and response hold the JSON reply that
+    generate_assessment_status hands back to the polling page.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    contributor = models.ForeignKey('User', on_delete=models.CASCADE, related_name='assessment_jobs')
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"AssessmentJob {self.id} ({self.status_code or 'running'})"
+
 class AssessmentSource(models.Model):
     assessment = models.ForeignKey(
         Assessment,
@@ -842,30 +864,6 @@ class ReleasePolicy(models.Model):
 
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from accounts.services.decision_maker import DecisionMakerService
-# from accounts.models import DecisionRun
-
-@receiver(post_save, sender=ContentScore)
-def auto_run_decision_maker(sender, instance, created, **kwargs):
-    if created:
-        DecisionMakerService().decide_for_chapter(
-            chapter_id=instance.upload.chapter.id,
-            force=True
-        )
-
-# Remove the import from the top of the file! 
-# Delete: from accounts.services.admin_agent import run_admin_release_for_course
-
-@receiver(post_save, sender=DecisionRun)
-def auto_run_admin_agent(sender, instance, created, **kwargs):
-    if created:
-        # Move import here to prevent Circular Import error
-        from accounts.services.admin_agent import AdminAgentService
-        
-        course = instance.chapter.course
-        # Instantiate the service and call the new method
-        service = AdminAgentService()
-        service.run_for_course(course)
 
 # For adaptive evaluation system
 class EvaluationRun(models.Model):
@@ -1070,6 +1068,39 @@ class StudentProfile(models.Model):
     def __str__(self):
         return f"{self.user.username} Profile"
     
+class CourseEmbedding(models.Model):
+    """
+    Stored sentence embedding of a course's text (name + objectives +
+    outcomes) for generate_expertise. text_hash / model_name tell whether
+    the vector is still current; stale rows are re-encoded and overwritten.
+    """
+    course = models.OneToOneField(Course, on_delete=models.CASCADE, related_name="embedding")
+    model_name = models.CharField(max_length=100)
+    text_hash = models.CharField(max_length=40)
+    vector = models.BinaryField()  # float32, L2-normalized
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Embedding for course {self.course_id} ({self.model_name})"
+
+
+class DriveFolderCache(models.Model):
+    """
+    Local index of Google Drive folder ids by (name, parent), filled by
+    GoogleDriveFolderService.get_or_create_folder.
+    """
+    name = models.CharField(max_length=255)
+    parent_id = models.CharField(max_length=128, blank=True, default="")
+    drive_id = models.CharField(max_length=128, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("name", "parent_id")
+
+    def __str__(self):
+        return f"{self.name} ({self.parent_id or 'root'}) -> {self.drive_id}"
+
+
 @receiver(post_save, sender=User)
 def create_student_profile(sender, instance, created, **kwargs):
     if created and instance.role == "STUDENT":
@@ -0,0 +1,34 @@
+"""
+Per-contributor cache for the dashboard's recommended courses + chapters JSON.
+
+Keys carry a global version, so a course / chapter / policy edit invalidates
+every contributor with a single incr (the default locmem backend has no
+delete_pattern). Uploads only drop the uploading contributor's entry.
+"""
+import time
+
+from django.core.cache import cache
+
+COURSES_TTL = 300  # seconds
+
+_VERSION_KEY = "contrib_courses:version"
+
+
+def _version() -> int:
+    # Seed from the clock so an evicted counter never revives stale keys.
+    return cache.get_or_set(_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def courses_key(user_id) -> str:
+    return f"contrib_courses:{_version()}:{user_id}"
+
+
+def invalidate_user(user_id) -> None:
+    cache.delete(courses_key(user_id))
+
+
+def invalidate_all() -> None:
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.set(_VERSION_KEY, time.time_ns(), timeout=None)
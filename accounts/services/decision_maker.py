@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
-from django.db.models import Prefetch
+from django.db.models import Case, F, FloatField, IntegerField, Prefetch, Value, When
+from django.db.models.functions import Coalesce, Greatest, NullIf
 
 from accounts.models import Chapter, ChapterPolicy, ContentScore, UploadCheck, ReleasedContent
 
@@ -37,6 +40,12 @@ class RankedCandidate:
     timestamp: Any
     composite_score: float
     scores: Dict[str, Optional[float]]  # per-metric raw scores
+    tiebreak: Tuple[float, ...] = ()  # scores in priority order, None -> -inf
+    non_null: int = 0  # number of metrics that actually have a score
+
+
+#: Ranking order (all descending): composite, per-metric tie-break, coverage, recency, id
+_RANK_KEY = attrgetter("composite_score", "tiebreak", "non_null", "timestamp", "upload_id")
 
 
 def _get_config() -> Dict[str, Any]:
@@ -193,21 +202,19 @@ def _get_reliable_metrics(
     return reliable, excluded
 
 
-def _confidence_weighted_average(
-    scores: Mapping[str, Optional[float]],
+def _confidence_weights(
     content_score,
     weights: Mapping[str, float],
-    missing: str,
-) -> tuple[float, list[str]]:
+) -> tuple[Dict[str, float], list[str]]:
     """
-    Weighted average that:
+    Per-upload weights for the adaptive weighted average:
       1. Excludes unreliable metrics (low conf AND high var)
       2. Boosts reliable metric weights proportional to their confidence
 
-    Returns (composite_score, excluded_fields).
+    Returns (boosted_weights, excluded_fields); excluded metrics are left out
+    of boosted_weights.
     """
-    available = [k for k in weights if k in scores or scores.get(k) is not None]
-    reliable, excluded = _get_reliable_metrics(content_score, available)
+    reliable, excluded = _get_reliable_metrics(content_score, list(weights))
 
     # Build confidence-boosted weights for reliable metrics
     boosted: Dict[str, float] = {}
@@ -225,21 +232,7 @@ def _confidence_weighted_average(
         else:
             boosted[m] = base_w
 
-    num = 0.0
-    den = 0.0
-    for m, w in boosted.items():
-        if w == 0:
-            continue
-        v = scores.get(m)
-        if v is None:
-            if missing == "zero":
-                den += w
-            continue
-        num += float(v) * w
-        den += w
-
-    composite = num / den if den > 0 else float("-inf")
-    return composite, excluded
+    return boosted, excluded
 
 
 def _weighted_average(scores: Mapping[str, Optional[float]], weights: Mapping[str, float], missing: str) -> float:
@@ -260,18 +253,95 @@ def _weighted_average(scores: Mapping[str, Optional[float]], weights: Mapping[st
     return num / den
 
 
-def _simple_average(scores: Mapping[str, Optional[float]], fields: Sequence[str], missing: str) -> float:
-    vals: List[float] = []
-    for f in fields:
-        v = scores.get(f)
-        if v is None:
-            if missing == "zero":
-                vals.append(0.0)
-            continue
-        vals.append(float(v))
-    if not vals:
-        return float("-inf")
-    return sum(vals) / len(vals)
+# -----------------------------------------------------------------------
+# COMPILED WEIGHTED-AVERAGE KERNEL
+# -----------------------------------------------------------------------
+# Scores are packed row-per-upload into a float64 matrix with NaN marking a
+# missing metric, next to a matching matrix of that upload's weights (0 for
+# an excluded metric). fastmath is deliberately off: it assumes no NaN/inf
+# and would fold away the missing-value branch and the -inf sentinel.
+def _weighted_avg_rows(S, W, missing_zero, out):  # compiled by _get_kernel
+    n, m = S.shape
+    for i in range(n):
+        num = 0.0
+        den = 0.0
+        for j in range(m):
+            w = W[i, j]
+            if w == 0.0:
+                continue
+            v = S[i, j]
+            if math.isnan(v):
+                if missing_zero:
+                    den += w
+                continue
+            num += v * w
+            den += w
+        out[i] = num / den if den > 0.0 else -math.inf
+
+
+#: numba-compiled _weighted_avg_rows; None until first use, False without numba
+_kernel = None
+
+
+def _get_kernel():
+    """
+    Compile the kernel on first use rather than at import: this module is
+    imported by every Django process (accounts.signals), including the MCP
+    subprocesses that never rank anything.
+    """
+    global _kernel
+    if _kernel is None:
+        try:
+            from numba import njit
+            _kernel = njit(cache=True)(_weighted_avg_rows)
+        except Exception:  # pragma: no cover - numba missing
+            _kernel = False
+    return _kernel or None
+
+
+def _weighted_average_many(
+    rows: Sequence[Mapping[str, Optional[float]]],
+    row_weights: Sequence[Mapping[str, float]],
+    fields: Sequence[str],
+    missing: str,
+) -> List[float]:
+    """
+    `_weighted_average` of each score row under its own weights, batched
+    through the compiled kernel; pure-Python fallback without numba.
+    """
+    global _kernel
+    kernel = _get_kernel() if rows else None
+    if kernel is not None:
+        import numpy as np
+
+        S = np.array(
+            [[np.nan if r.get(k) is None else float(r[k]) for k in fields] for r in rows],
+            dtype=np.float64,
+        ).reshape(len(rows), len(fields))
+        W = np.array(
+            [[float(w.get(k, 0.0)) for k in fields] for w in row_weights],
+            dtype=np.float64,
+        ).reshape(len(rows), len(fields))
+        out = np.empty(len(rows))
+        try:
+            kernel(S, W, missing == "zero", out)
+            return [float(v) for v in out]
+        except Exception:  # pragma: no cover - failed to compile
+            logger.exception("[decision] weighted-average kernel failed; using pure Python")
+            _kernel = False
+    return [_weighted_average(r, w, missing) for r, w in zip(rows, row_weights)]
+
+
+def _leaderboard(ranked: Sequence[RankedCandidate], top_k: int) -> List[dict]:
+    """Leaderboard entries as persisted on DecisionRun.ranking and returned to callers."""
+    return [
+        {
+            "upload_id": c.upload_id,
+            "composite_score": c.composite_score,
+            "scores": c.scores,
+        }
+        for c in ranked[:top_k]
+    ]
 
 
 class DecisionMakerService:
@@ -284,6 +354,26 @@ class DecisionMakerService:
         self.primary_strategy: str = cfg.get("primary_strategy", DEFAULT_PRIMARY_STRATEGY)
         self.missing_strategy: str = cfg.get("missing_strategy", DEFAULT_MISSING_STRATEGY)  # ignore | zero
         self.algorithm_version: str = cfg.get("algorithm_version", ALGORITHM_VERSION)
+
+        # Score fields, priority and weights are fixed for the life of the service.
+        self._available: List[str] = _available_score_fields()
+        self._priority: List[str] = _resolve_priority(self._available)
+        self._weights: Dict[str, float] = _resolve_weights(self._available)
+        # One C-level call pulls every score field off a ContentScore row.
+        self._score_getter = attrgetter(*self._available) if self._available else None
+
+        # Chapters with at least this many uploads are ranked in SQL (None = never).
+        threshold = cfg.get("db_ranking_threshold")
+        self._db_ranking_threshold: Optional[int] = int(threshold) if threshold is not None else None
+
+        # primary_strategy never changes per call: pick the per-upload weighting once.
+        # simple_average is the weighted average with every weight at 1.
+        self._unit_weights: Dict[str, float] = {f: 1.0 for f in self._available}
+        self._weights_fn = (
+            self._weights_simple
+            if self.primary_strategy == "simple_average"
+            else self._weights_adaptive
+        )
         _p(
             f"version={self.algorithm_version}"
         )
@@ -320,26 +410,37 @@ class DecisionMakerService:
         if only_evaluated_uploads:
             uploads_qs = uploads_qs.filter(evaluation_status=True)
 
-        uploads_qs = uploads_qs.prefetch_related(
-            Prefetch("content_score", queryset=ContentScore.objects.all())
-        )
-        uploads = list(uploads_qs)
+        top_k = max(1, int(top_k_audit or 3))
+        n_uploads = uploads_qs.count() if self._db_ranking_threshold is not None else None
+        rank_in_db = self._can_rank_in_db(n_uploads)
+        if rank_in_db:
+            uploads = None
+        else:
+            uploads = list(
+                uploads_qs.prefetch_related(
+                    Prefetch("content_score", queryset=ContentScore.objects.all())
+                )
+            )
+            n_uploads = len(uploads)
 
         if policy and min_contributions_policy == "respect":
             need = int(policy.min_contributions or 0)
-            _p(f"Min contributions check | have={len(uploads)} need={need}")
-            if len(uploads) < need:
+            _p(f"Min contributions check | have={n_uploads} need={need}")
+            if n_uploads < need:
                 _p("Gate: min_contributions_not_met -> returning None (not_ready)")
                 return self._persist_or_return_none(
                     chapter=chapter,
                     policy=policy,
                     status="not_ready",
-                    reason=f"min_contributions_not_met: {len(uploads)}/{policy.min_contributions}",
+                    reason=f"min_contributions_not_met: {n_uploads}/{policy.min_contributions}",
                     persist=persist,
                 )
 
-        _p("Ranking uploads...")
-        ranked = self.rank_uploads(chapter_id=chapter_id, uploads=uploads)
+        _p("Ranking uploads..." + (" (database)" if rank_in_db else ""))
+        if rank_in_db:
+            ranked = self.rank_uploads_db(chapter_id=chapter_id, uploads_qs=uploads_qs, top_k=top_k)
+        else:
+            ranked = self.rank_uploads(chapter_id=chapter_id, uploads=uploads)
 
         _p(f"Ranking done | ranked_count={len(ranked)}")
         if ranked:
@@ -356,7 +457,6 @@ class DecisionMakerService:
             )
 
         winner = ranked[0]
-        top_k = max(1, int(top_k_audit or 3))
         _p(f"Winner selected | upload_id={winner.upload_id} composite={winner.composite_score:.4f} top_k={top_k}")
 
         run_obj = None
@@ -385,26 +485,27 @@ class DecisionMakerService:
             "chapter_id": chapter_id,
             "selected_upload_id": winner.upload_id,
             "composite_score": winner.composite_score,
-            "leaderboard": [c.__dict__ for c in ranked[:top_k]],
+            "leaderboard": _leaderboard(ranked, top_k),
         }
 
     def rank_uploads(self, *, chapter_id: int, uploads: Sequence[UploadCheck]) -> List[RankedCandidate]:
         _p(f"rank_uploads start | chapter_id={chapter_id} uploads_in={len(uploads)}")
 
-        available = _available_score_fields()
+        available = self._available
         _p(f"Available score fields = {available}")
         if not available:
             _p("No numeric score fields found in ContentScore -> returning []")
             return []
 
-        priority = _resolve_priority(available)
-        weights = _resolve_weights(available)
+        priority = self._priority
+        weights = self._weights
 
         _p(f"Priority order = {priority}")
         _p(f"Weights = {weights}")
         _p(f"Primary strategy = {self.primary_strategy} | missing strategy = {self.missing_strategy}")
 
-        candidates: List[RankedCandidate] = []
+        scored: List[Tuple[UploadCheck, Dict[str, Optional[float]]]] = []
+        upload_weights: List[Mapping[str, float]] = []
         for u in uploads:
             _p(f"Scoring upload_id={u.id} contributor_id={u.contributor_id} ts={u.timestamp}")
             try:
@@ -413,79 +514,40 @@ class DecisionMakerService:
                 _p(f"Skip upload_id={u.id} (no content_score attached)")
                 continue
 
-            scores: Dict[str, Optional[float]] = {
-                f: _float_or_none(getattr(score_obj, f, None)) for f in available
-            }
+            vals = self._score_getter(score_obj)
+            if len(available) == 1:
+                vals = (vals,)
+            scores: Dict[str, Optional[float]] = dict(zip(available, map(_float_or_none, vals)))
             _p(f"Scores upload_id={u.id} => {scores}")
 
-            excluded_metrics: list[str] = []
+            row_weights, excluded_metrics = self._weights_fn(u, score_obj)
 
-            if self.primary_strategy == "simple_average":
-                composite = _simple_average(scores, available, self.missing_strategy)
-                _p(f"Composite strategy=simple_average upload_id={u.id} => {composite}")
+            if excluded_metrics:
+                _p(f"upload_id={u.id} unreliable metrics excluded from composite: {excluded_metrics}")
 
-            else:
-                # ── Adaptive confidence-weighted scoring ────────────────────────
-                # Checks per-upload confidence/variance; excludes unreliable metrics.
-                # Falls back to plain weighted_average when no multi-run data exists.
-                has_multirun_data = any(
-                    getattr(score_obj, f"{m}_confidence", None) is not None
-                    for m in _ADAPTIVE_METRICS
-                    if m in available
-                )
+            scored.append((u, scores))
+            upload_weights.append(row_weights)
+
+        composites = _weighted_average_many(
+            [scores for _, scores in scored], upload_weights, available, self.missing_strategy
+        )
 
-                if has_multirun_data:
-                    composite, excluded_metrics = _confidence_weighted_average(
-                        scores, score_obj, weights, self.missing_strategy
-                    )
-                    if excluded_metrics:
-                        _p(
-                            f"Adaptive: upload_id={u.id} excluded metrics={excluded_metrics} "
-                            f"(low confidence + high variance)"
-                        )
-                    _p(f"Composite strategy=adaptive_confidence upload_id={u.id} => {composite}")
-                else:
-                    composite = _weighted_average(scores, weights, self.missing_strategy)
-                    _p(f"Composite strategy=weighted_average upload_id={u.id} => {composite} "
-                       f"(no multi-run data; static weights used)")
-
-            if composite == float("-inf"):
+        neg_inf = float("-inf")
+        candidates: List[RankedCandidate] = []
+        for (u, scores), composite in zip(scored, composites):
+            _p(f"Composite strategy={self.primary_strategy} upload_id={u.id} => {composite}")
+            if composite == neg_inf:
                 _p(f"Skip upload_id={u.id} (composite=-inf)")
                 continue
 
-            candidates.append(
-                RankedCandidate(
-                    upload_id=u.id,
-                    chapter_id=chapter_id,
-                    contributor_id=u.contributor_id,
-                    timestamp=u.timestamp,
-                    composite_score=float(composite),
-                    scores=scores,
-                )
-            )
-            if excluded_metrics:
-                _p(f"upload_id={u.id} unreliable metrics excluded from composite: {excluded_metrics}")
+            candidates.append(self._candidate(u, chapter_id, scores, composite))
 
         if not candidates:
             _p("No candidates after scoring -> returning []")
             return []
 
-        def sort_key(c: RankedCandidate) -> Tuple:
-            tiebreak_vals = []
-            for p in priority:
-                v = c.scores.get(p)
-                tiebreak_vals.append(float(v) if v is not None else float("-inf"))
-            non_null = sum(1 for v in c.scores.values() if v is not None)
-            return (
-                c.composite_score,
-                *tiebreak_vals,
-                non_null,
-                c.timestamp,
-                c.upload_id,
-            )
-
         _p(f"Sorting candidates | count={len(candidates)}")
-        candidates.sort(key=sort_key, reverse=True)
+        candidates.sort(key=_RANK_KEY, reverse=True)
 
         _p("Sorted. Top 3 candidates:")
         for i, cc in enumerate(candidates[:3], start=1):
@@ -493,6 +555,151 @@ class DecisionMakerService:
 
         return candidates
 
+    def _can_rank_in_db(self, n_uploads: Optional[int]) -> bool:
+        """
+        Chapters with at least db_ranking_threshold uploads are ranked in SQL.
+        Python stays in charge when every score field could be excluded as
+        unreliable, since only it falls back to the full set in that case.
+        """
+        threshold = self._db_ranking_threshold
+        if threshold is None or n_uploads is None or not self._available:
+            return False
+        if self.primary_strategy != "simple_average" and all(
+            f in _ADAPTIVE_METRICS and f not in _PROTECTED_METRICS for f in self._available
+        ):
+            return False
+        return n_uploads >= threshold
+
+    def _adaptive_weight_expr(self, field_name: str, w: float):
+        """
+        SQL form of the weight _weights_adaptive gives field_name: the static
+        weight without confidence data, 0 when excluded (low confidence AND
+        high variance, unprotected metrics only), else boosted by confidence.
+        """
+        if field_name not in _ADAPTIVE_METRICS:
+            return Value(w, output_field=FloatField())
+
+        conf = F(f"content_score__{field_name}_confidence")
+        min_boost = 0.8 if field_name in _PROTECTED_METRICS else 0.5
+        whens = []
+        if field_name not in _PROTECTED_METRICS:
+            low_conf, high_var = _get_metric_thresholds(field_name)
+            whens.append(When(
+                **{
+                    f"content_score__{field_name}_confidence__lt": low_conf,
+                    f"content_score__{field_name}_variance__gt": high_var,
+                },
+                then=Value(0.0),
+            ))
+        whens.append(When(
+            **{f"content_score__{field_name}_confidence__isnull": False},
+            then=Value(w) * Greatest(Value(min_boost), conf, output_field=FloatField()),
+        ))
+        return Case(*whens, default=Value(w), output_field=FloatField())
+
+    def rank_uploads_db(self, *, chapter_id: int, uploads_qs, top_k: int) -> List[RankedCandidate]:
+        """
+        Same ordering as rank_uploads, computed by the database: composite DESC,
+        priority metrics DESC NULLS LAST, non-null count, timestamp, id.
+        The adaptive strategy's per-upload confidence weights are computed in
+        SQL too. Only the top_k rows are fetched.
+        """
+        zero_missing = self.missing_strategy == "zero"
+
+        num = Value(0.0, output_field=FloatField())
+        den = Value(0.0, output_field=FloatField())
+        simple = self.primary_strategy == "simple_average"
+        for f, w in (self._unit_weights if simple else self._weights).items():
+            if w == 0:
+                continue
+            weight = Value(w, output_field=FloatField()) if simple else self._adaptive_weight_expr(f, w)
+            col = f"content_score__{f}"
+            num = num + Coalesce(F(col), Value(0.0), output_field=FloatField()) * weight
+            den = den + Case(
+                When(**{f"{col}__isnull": False}, then=weight),
+                default=weight if zero_missing else Value(0.0),
+                output_field=FloatField(),
+            )
+
+        non_null = Value(0, output_field=IntegerField())
+        for f in self._available:
+            non_null = non_null + Case(
+                When(**{f"content_score__{f}__isnull": False}, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+
+        rows = (
+            uploads_qs.filter(content_score__isnull=False)
+            .select_related("content_score")
+            .annotate(
+                composite=num / NullIf(den, Value(0.0)),
+                non_null=non_null,
+            )
+            .filter(composite__isnull=False)
+            .order_by(
+                F("composite").desc(),
+                *[F(f"content_score__{p}").desc(nulls_last=True) for p in self._priority],
+                F("non_null").desc(),
+                F("timestamp").desc(),
+                F("id").desc(),
+            )[:top_k]
+        )
+
+        candidates: List[RankedCandidate] = []
+        for u in rows:
+            vals = self._score_getter(u.content_score)
+            if len(self._available) == 1:
+                vals = (vals,)
+            scores = dict(zip(self._available, map(_float_or_none, vals)))
+            candidates.append(self._candidate(u, chapter_id, scores, u.composite))
+
+        _p(f"rank_uploads_db | chapter_id={chapter_id} returned={len(candidates)} top_k={top_k}")
+        return candidates
+
+    def _candidate(
+        self, u: UploadCheck, chapter_id: int, scores: Dict[str, Optional[float]], composite: float
+    ) -> RankedCandidate:
+        neg_inf = float("-inf")
+        return RankedCandidate(
+            upload_id=u.id,
+            chapter_id=chapter_id,
+            contributor_id=u.contributor_id,
+            timestamp=u.timestamp,
+            composite_score=float(composite),
+            scores=scores,
+            tiebreak=tuple(
+                v if v is not None else neg_inf
+                for v in (scores.get(p) for p in self._priority)
+            ),
+            non_null=sum(1 for v in scores.values() if v is not None),
+        )
+
+    def _weights_simple(self, u: UploadCheck, score_obj: ContentScore) -> Tuple[Mapping[str, float], List[str]]:
+        return self._unit_weights, []
+
+    def _weights_adaptive(self, u: UploadCheck, score_obj: ContentScore) -> Tuple[Mapping[str, float], List[str]]:
+        # ── Adaptive confidence-weighted scoring ────────────────────────
+        # Checks per-upload confidence/variance; excludes unreliable metrics
+        # and boosts the rest. Uploads without multi-run data keep the
+        # static weights.
+        has_multirun_data = any(
+            getattr(score_obj, f"{m}_confidence", None) is not None
+            for m in _ADAPTIVE_METRICS
+            if m in self._available
+        )
+        if not has_multirun_data:
+            _p(f"Adaptive: upload_id={u.id} has no multi-run data; static weights used")
+            return self._weights, []
+
+        boosted, excluded_metrics = _confidence_weights(score_obj, self._weights)
+        if excluded_metrics:
+            _p(
+                f"Adaptive: upload_id={u.id} excluded metrics={excluded_metrics} "
+                f"(low confidence + high variance)"
+            )
+        return boosted, excluded_metrics
+
     # ---------------------------
     # persistence helpers
     # ---------------------------
@@ -559,16 +766,7 @@ class DecisionMakerService:
 
         release_threshold = float(getattr(policy, "release_threshold", 0.0) or 0.0) if policy else 0.0
 
-        leaderboard: List[dict] = []
-        if ranked:
-            for c in list(ranked)[: max(1, int(top_k))]:
-                leaderboard.append(
-                    {
-                        "upload_id": c.upload_id,
-                        "composite_score": c.composite_score,
-                        "scores": c.scores,
-                    }
-                )
+        leaderboard = _leaderboard(ranked or (), max(1, int(top_k)))
 
         _p(f"Leaderboard built | entries={len(leaderboard)} top_k={top_k}")
 
@@ -0,0 +1,44 @@
+"""
+The sentence-transformers model shared by expertise generation and the
+contributor chat cache, loaded once per process.
+
+Server processes warm it up in the background at startup (oer/wsgi.py,
+oer/asgi.py) so no request waits for the load; request code uses loaded_model() and
+skips embedding work until it is ready.
+"""
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_model():
+    """The SentenceTransformer for MODEL_NAME, loaded on first use."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            from sentence_transformers import SentenceTransformer
+            _model = SentenceTransformer(MODEL_NAME)
+        return _model
+
+
+def loaded_model():
+    """The model if it has finished loading, else None (never blocks)."""
+    return _model
+
+
+def preload_in_background() -> None:
+    """Start loading the model on a daemon thread."""
+    def load():
+        try:
+            get_model()
+            logger.info("Embedding model %s loaded", MODEL_NAME)
+        except Exception:
+            logger.exception("Could not load embedding model %s", MODEL_NAME)
+
+    threading.Thread(target=load, name="embedding-model-preload", daemon=True).start()
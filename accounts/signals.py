@@ -1,12 +1,49 @@
-from django.db.models.signals import post_save
+import logging
+import threading
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from accounts.models import ContentScore, DecisionRun
+from accounts.models import (
+    Chapter,
+    ChapterContributionProgress,
+    ChapterPolicy,
+    ContentScore,
+    DecisionRun,
+    Expertise,
+    UploadCheck,
+    User,
+)
+from accounts.services import dashboard_cache
 from accounts.services.decision_maker import DecisionMakerService
 
+logger = logging.getLogger(__name__)
+
 # Reentrancy guard: prevents signal → DecisionMaker → save → signal loops
 _RUNNING_DM = set()   # chapter_ids currently being processed
 
+# Per-thread decision session. While the ContentScore receiver is driving the
+# DecisionMaker, nested DecisionRun / is_best saves only record their course here;
+# the admin agent then runs once per course after the outer save commits.
+_session = threading.local()
+
+
+def _run_admin_agent(course_id):
+    try:
+        from accounts.services.admin_agent import AdminAgentService
+        AdminAgentService().run_for_course(course_id)
+    except Exception:
+        logger.exception("[Signal] admin agent failed for course_id=%s", course_id)
+
+
+def _schedule_admin_agent(course_id):
+    pending = getattr(_session, "pending_courses", None)
+    if pending is not None:
+        pending.add(course_id)
+        return
+    transaction.on_commit(lambda: _run_admin_agent(course_id))
+
 
 @receiver(post_save, sender=ContentScore)
 def auto_run_decision_maker(sender, instance, created, **kwargs):
@@ -37,6 +74,10 @@ def auto_run_decision_maker(sender, instance, created, **kwargs):
         if policy.is_open:
             return
 
+        outer = getattr(_session, "pending_courses", None) is None
+        if outer:
+            _session.pending_courses = set()
+
         _RUNNING_DM.add(chapter_id)
         try:
             DecisionMakerService().decide_for_chapter(
@@ -45,10 +86,13 @@ def auto_run_decision_maker(sender, instance, created, **kwargs):
             )
         finally:
             _RUNNING_DM.discard(chapter_id)
+            if outer:
+                courses, _session.pending_courses = _session.pending_courses, None
+                for course_id in courses:
+                    transaction.on_commit(lambda cid=course_id: _run_admin_agent(cid))
 
     except Exception:
-        import logging
-        logging.getLogger(__name__).exception(
+        logger.exception(
             "[Signal] auto_run_decision_maker failed for ContentScore id=%s", instance.id
         )
 
@@ -57,7 +101,7 @@ def auto_run_decision_maker(sender, instance, created, **kwargs):
 def auto_mint_on_best_change(sender, instance, created, **kwargs):
     """
     When ContentScore.is_best is set to True (via admin or any save),
-    immediately run the admin agent for that course so:
+    run the admin agent for that course (after commit) so:
       1. Release statuses are recalculated.
       2. Certificates are minted for the best contributor.
 
@@ -68,12 +112,9 @@ def auto_mint_on_best_change(sender, instance, created, **kwargs):
         return  # only care about is_best=True
 
     try:
-        from accounts.services.admin_agent import AdminAgentService
-        course = instance.upload.chapter.course
-        AdminAgentService().run_for_course(course)
+        _schedule_admin_agent(instance.upload.chapter.course_id)
     except Exception:
-        import logging
-        logging.getLogger(__name__).exception(
+        logger.exception(
             "[Signal] auto_mint_on_best_change failed for ContentScore id=%s", instance.id
         )
 
@@ -82,6 +123,26 @@ def auto_mint_on_best_change(sender, instance, created, **kwargs):
 def auto_run_admin_agent(sender, instance, created, **kwargs):
     """Run the admin release + cert pipeline whenever a DecisionRun is created."""
     if created:
-        from accounts.services.admin_agent import AdminAgentService
-        course = instance.chapter.course
-        AdminAgentService().run_for_course(course)
\ No newline at end of file
+        _schedule_admin_agent(instance.chapter.course_id)
+
+
+# ── Contributor dashboard cache ──────────────────────────────────────────
+@receiver([post_save, post_delete], sender=Chapter)
+@receiver([post_save, post_delete], sender=ChapterPolicy)
+def invalidate_dashboard_courses(sender, **kwargs):
+    """Course structure / deadlines changed: drop every cached dashboard."""
+    dashboard_cache.invalidate_all()
+
+
+@receiver(m2m_changed, sender=Expertise.courses.through)
+@receiver(m2m_changed, sender=User.domain_of_expertise.through)
+def invalidate_dashboard_recommendations(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        dashboard_cache.invalidate_all()
+
+
+@receiver([post_save, post_delete], sender=UploadCheck)
+@receiver([post_save, post_delete], sender=ChapterContributionProgress)
+def invalidate_contributor_dashboard(sender, instance, **kwargs):
+    """Upload counts / submitted flags changed for one contributor."""
+    dashboard_cache.invalidate_user(instance.contributor_id)
@@ -3,11 +3,11 @@ from .views import views
 from django.contrib.auth import views as auth_views
 from .views.contributor import generate_expertise
 from .views.contributor.contributor_dashboard import contributor_dashboard_view, contributor_submit_content_view, \
-    contributor_profile, contributor_submissions, add_note, edit_note, delete_note, get_note
+    contributor_profile, contributor_submissions, notes_batch, get_note
 from .views.contributor.submit_content import upload_files, load_file, contributor_editor, delete_drive_file, \
     confirm_submission, gemini_chat, contributor_upload_file, \
-    generate_assessment, after_submission, generated_assessment_form, list_resources, add_resource, delete_resource, \
-    check_topic_quality
+    generate_assessment, generate_assessment_status, after_submission, generated_assessment_form, list_resources, \
+    add_resource, delete_resource, check_topic_quality
 from .views.home.home import about, contact
 from .views.home.subjects import subject_view, chapter_view
 
@@ -133,6 +133,8 @@ path("student/drive/<int:course_id>/<str:file_id>/", drive_stream, name="drive_s
     # path('contributor/submission-complete/', after_submission_view, name='after_submission'), # Thank you page
     # Assessment page (might need chapter_id or upload_id)
     path('contributor/generate_assessment', generate_assessment, name='generate_assessment'),
+    path('contributor/generate_assessment/<uuid:job_id>/status', generate_assessment_status,
+         name='generate_assessment_status'),
     path('contributor/generated_assessment/<int:assessment_id>/', generated_assessment_form,
          name='generated_assessment_form'),
     path("contributor/confirm_submission", confirm_submission, name="confirm_submission"),
@@ -187,9 +189,7 @@ path("student/drive/<int:course_id>/<str:file_id>/", drive_stream, name="drive_s
     path("dashboard/contributor/submit_content/resources/delete/", delete_resource, name="delete_resource"),
 
     # Contributor Notes
-    path("dashboard/contributor/notes/add/", add_note, name="add_note"),
-    path("dashboard/contributor/notes/edit/<int:note_id>/", edit_note, name="edit_note"),
-    path("dashboard/contributor/notes/delete/<int:note_id>/", delete_note, name="delete_note"),
+    path("dashboard/contributor/notes/batch/", notes_batch, name="notes_batch"),
     path("dashboard/contributor/notes/<id>/", get_note, name="get_note"),
 ]
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Semantic reply cache for the contributor Gemini chat.
+
+Text-only messages are embedded with the same MiniLM model used for
+expertise generation (accounts.services.embeddings); a new message whose
+embedding is close enough to one the same user already asked is answered
+with the stored reply instead of a Gemini call. Each user keeps a small
+bounded list of (embedding, reply) pairs in the Django cache, so a
+brute-force cosine search is enough.
+
+The entries live in the default cache backend. With the default per-process
+LocMemCache each worker process has its own entries (and they compete with
+every other cache user for its 300 slots); configure a shared backend
+(Redis / Memcached / database cache in settings.CACHES) for the cache to
+hit across processes.
+"""
+from typing import Optional
+
+import numpy as np
+from django.core.cache import cache
+
+from accounts.services import embeddings
+
+SIMILARITY_THRESHOLD = 0.92
+CACHE_TTL = 24 * 60 * 60
+MAX_ENTRIES = 200
+
+
+def _cache_key(user_id) -> str:
+    return f"gemini_chat:semantic:{embeddings.MODEL_NAME}:{user_id}"
+
+
+def embed_message(message: str) -> Optional[np.ndarray]:
+    """Normalized embedding of message, or None while the model is still loading."""
+    model = embeddings.loaded_model()
+    if model is None:
+        return None
+    return model.encode(
+        [message], normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False
+    )[0].astype(np.float32)
+
+
+def lookup_reply(user_id, embedding: np.ndarray) -> Optional[str]:
+    """Stored reply of this user's most similar earlier message, if similar enough."""
+    entry = cache.get(_cache_key(user_id))
+    if not entry:
+        return None
+    scores = entry["embeddings"] @ embedding
+    best = int(np.argmax(scores))
+    if scores[best] < SIMILARITY_THRESHOLD:
+        return None
+    return entry["replies"][best]
+
+
+def store_reply(user_id, embedding: np.ndarray, reply: str) -> None:
+    key = _cache_key(user_id)
+    entry = cache.get(key) or {
+        "embeddings": np.empty((0, embedding.shape[0]), dtype=np.float32),
+        "replies": [],
+    }
+    # newest last; the oldest entries fall off once the list is full
+    cache.set(key, {
+        "embeddings": np.vstack([entry["embeddings"], embedding])[-MAX_ENTRIES:],
+        "replies": (entry["replies"] + [reply])[-MAX_ENTRIES:],
+    }, CACHE_TTL)
@@ -1,7 +1,13 @@
 import json
+import logging
 import re
 import os
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Dict, List, Optional
 
 from django.conf import settings
 from django.http import JsonResponse
@@ -11,8 +17,14 @@ from django.contrib import messages
 
 from google.auth.exceptions import RefreshError
 
-from langgraph_agents.services.drive_service import GoogleDriveAuthService, GoogleDriveFolderService
+from langgraph_agents.services.drive_service import (
+    FOLDER_MIME,
+    GoogleDriveAuthService,
+    GoogleDriveFolderService,
+    drive_q_escape,
+)
 from .expertise_service import save_user_expertise
+from ...services import dashboard_cache
 from ...models import Course, Chapter, UploadCheck, ChapterContributionProgress
 from django.contrib.auth.decorators import login_required
 from django.db.models import Count, Q
@@ -39,16 +51,45 @@ from django.utils import timezone
 # make sure ChapterPolicy is importable in this file (if you have it)
 from accounts.models import Course, Chapter, ChapterPolicy, User
 
-from django.db.models import Prefetch, Exists, OuterRef
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Exists, OuterRef, Subquery, F
+from django.db.models.functions import Coalesce
 from django.utils.dateparse import parse_datetime
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _json_loads = json.loads
+
+
 # ==============================
 # Authorization Guard
 # ==============================
 class ContributorAccessGuard:
     @staticmethod
     def ensure_contributor(user) -> bool:
-        return user.role == "CONTRIBUTOR"
+        return user.role == User.Role.CONTRIBUTOR
+
+
+def contributor_required(view_func):
+    """403 for non-contributors before the view body builds any querysets."""
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        if not ContributorAccessGuard.ensure_contributor(request.user):
+            return render(request, "403.html", status=403)
+        return view_func(request, *args, **kwargs)
+    return _wrapped
 
 
 # ==============================
@@ -57,63 +98,110 @@ class ContributorAccessGuard:
 class ContributorCourseService:
     @staticmethod
     def get_recommended_courses(user):
-        expertises = user.domain_of_expertise.all()
-        return (
-            Course.objects
-            .filter(expertises__in=expertises)
-            .distinct()
+        # Semijoin on the M2M table instead of JOIN + DISTINCT over Course rows;
+        # the user's expertise ids stay a subquery (no extra round trip).
+        return Course.objects.filter(
+            Exists(
+                Course.expertises.through.objects.filter(
+                    course_id=OuterRef("pk"),
+                    expertise_id__in=user.domain_of_expertise.values("id"),
+                )
+            )
         )
 
-    @staticmethod
-    def get_chapters_by_course(courses, user):
-        chapters_map = {}
-
-        # progress map (chapter_id -> total_uploads)
-        progress_qs = ChapterContributionProgress.objects.filter(contributor=user)
-        progress_map = {p.chapter_id: p.total_uploads for p in progress_qs}
-
-        # submitted map (chapter_id -> upload_id)  (exists = submitted)
-        submitted_qs = UploadCheck.objects.filter(contributor=user).order_by("-timestamp")
-        submitted_map = {}
-        for u in submitted_qs:
-            # keep latest upload per chapter
-            if u.chapter_id not in submitted_map:
-                submitted_map[u.chapter_id] = u.id
-
-        for course in courses:
-            chapters = Chapter.objects.filter(course=course).select_related("course")
-            chapters = chapters.select_related("course__scheme", "course__department", "course__department__program")
+    @classmethod
+    def get_dashboard_courses(cls, user):
+        """
+        (courses, chapters_json) for the dashboard, cached per contributor.
+        Entries never outlive the next chapter deadline so is_open stays right.
+        """
+        key = dashboard_cache.courses_key(user.id)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        # plain rows with only what the course cards render: no Course / Scheme /
+        # Department instances to build, and a smaller pickle in the cache
+        courses = list(
+            cls.get_recommended_courses(user)
+            .values(
+                "id", "course_code", "course_name", "year_of_study", "semester",
+                scheme_name=F("scheme__name"),
+                dept_name=F("department__dept_name"),
+                program_name=F("department__program__program_name"),
+            )
+        )
+        chapters_map = cls.get_chapters_by_course(courses, user)
 
-            chapter_list = []
+        ttl = dashboard_cache.COURSES_TTL
+        now = timezone.now()
+        for chapters in chapters_map.values():
             for ch in chapters:
-                policy = getattr(ch, "policy", None)
+                if ch["is_open"] and ch["deadline"]:
+                    until = (parse_datetime(ch["deadline"]) - now).total_seconds()
+                    ttl = min(ttl, max(1, int(until) + 1))
 
-                deadline = None
-                is_open = True
+        cached = (courses, _json_dumps(chapters_map))
+        cache.set(key, cached, ttl)
+        return cached
 
-                if policy:
-                    deadline_dt = policy.current_deadline or policy.deadline
-                    if deadline_dt:
-                        deadline = deadline_dt.isoformat()
-                        is_open = timezone.now() <= deadline_dt
+    @staticmethod
+    def get_chapters_by_course(courses, user):
+        # seed every course so ones without chapters still get an (empty) entry
+        course_ids = [course["id"] for course in courses]
+        chapters_map = {str(course_id): [] for course_id in course_ids}
 
-                total_uploads = progress_map.get(ch.id, 0)
-                upload_id = submitted_map.get(ch.id)  # if exists => submitted
+        # contributor status computed per chapter in the same SELECT
+        user_progress = ChapterContributionProgress.objects.filter(
+            chapter_id=OuterRef("pk"), contributor=user
+        )
+        # latest upload per chapter (exists = submitted): one small query for the
+        # contributor's uploads instead of a correlated subquery on every chapter
+        latest_upload_id = dict(
+            UploadCheck.objects
+            .filter(contributor=user, chapter__course_id__in=course_ids)
+            .order_by("timestamp", "id")
+            .values_list("chapter_id", "id")
+        )
+
+        rows = (
+            Chapter.objects
+            .filter(course_id__in=course_ids)
+            .annotate(
+                deadline_dt=Coalesce("policy__current_deadline", "policy__deadline"),
+                total_uploads=Coalesce(
+                    Subquery(
+                        user_progress
+                        .annotate(files=F("pdf_count") + F("video_count"))
+                        .values("files")[:1]
+                    ),
+                    0,
+                ),
+            )
+            .values(
+                "course_id", "id", "chapter_number", "chapter_name",
+                "deadline_dt", "total_uploads",
+            )
+            .order_by("course_id", "chapter_number")
+        )
 
-                chapter_list.append({
-                    "id": ch.id,
-                    "chapter_number": ch.chapter_number,
-                    "chapter_name": ch.chapter_name,
-                    "deadline": deadline,
-                    "is_open": is_open,
+        now = timezone.now()
+        for course_id, chapters in groupby(rows, key=itemgetter("course_id")):
+            chapters_map[str(course_id)] = [
+                {
+                    "id": ch["id"],
+                    "chapter_number": ch["chapter_number"],
+                    "chapter_name": ch["chapter_name"],
+                    "deadline": ch["deadline_dt"].isoformat() if ch["deadline_dt"] else None,
+                    "is_open": ch["deadline_dt"] is None or now <= ch["deadline_dt"],
 
                     # contributor status fields
-                    "total_uploads": total_uploads,
-                    "submitted": bool(upload_id),
-                    "upload_id": upload_id,  # optional (use later if needed)
-                })
-
-            chapters_map[str(course.id)] = chapter_list
+                    "total_uploads": ch["total_uploads"],
+                    "submitted": ch["id"] in latest_upload_id,
+                    "upload_id": latest_upload_id.get(ch["id"]),  # optional (use later if needed)
+                }
+                for ch in chapters
+            ]
 
         return chapters_map
 
@@ -122,9 +210,11 @@ class ContributorCourseService:
 # Submission Query Service
 # ==============================
 class ContributorSubmissionService:
+    PAGE_SIZE = 25
+
     @staticmethod
-    def get_user_submissions(user):
-        return (
+    def get_user_submissions(user, page=None, page_size=PAGE_SIZE):
+        uploads = (
             UploadCheck.objects
             .select_related(
                 "chapter",
@@ -134,8 +224,9 @@ class ContributorSubmissionService:
                 "chapter__course__department__program",
             )
             .filter(contributor=user)
-            .order_by("-timestamp")
+            .order_by("-timestamp", "-id")
         )
+        return Paginator(uploads, page_size).get_page(page)
 
     @staticmethod
     def has_existing_submission(contributor_id, chapter_id) -> bool:
@@ -148,196 +239,278 @@ class ContributorSubmissionService:
 # ==============================
 # Contributor Drive Facade
 # ==============================
+_DRIVE: Optional["ContributorDriveFacade"] = None
+_DRIVE_LOCK = threading.Lock()
+
+# Long-lived workers for independent Drive listings: each keeps its own
+# thread-local Drive client (see GoogleDriveAuthService.get_service).
+_DRIVE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="contributor-drive")
+
+
 class ContributorDriveFacade:
     """
     High-level facade used ONLY by views.
     Internally uses OOP Drive services.
-    """
-
-    def __init__(self):
-        self.service = GoogleDriveAuthService.get_service()
-        self.folder_service = GoogleDriveFolderService(self.service)
-        self.oer_root_id = self.folder_service.get_or_create_folder("oer_content")
-
-    def get_all_files_for_chapter(
-            self,
-            contributor_id: int,
-            course_id: int,
-            chapter_number: int
-    ) -> List[dict]:
-
-        files: List[dict] = []
 
-        for folder_type in ["drafts", "pdf", "videos", "assessments"]:
-            files.extend(
-                self._get_files_by_type(
-                    contributor_id,
-                    course_id,
-                    chapter_number,
-                    folder_type
-                )
-            )
+    Use ``instance()``: the auth service and the oer_content / category
+    folder ids are resolved once per process and reused across requests.
+    Call ``reset()`` when a Drive call raises ``RefreshError``.
+    """
 
-        return files
+    PARENTS_PER_QUERY = 50  # keeps the OR-ed q string well under Drive's limit
 
-    def _get_files_by_type(
+    def __init__(self):
+        self.oer_root_id = self.folder_service.get_oer_root_id()
+        self._category_roots: Dict[str, str] = {}
+
+    @property
+    def service(self):
+        # The facade is shared across threads; the Drive client is per thread.
+        return GoogleDriveAuthService.get_service()
+
+    @property
+    def folder_service(self) -> GoogleDriveFolderService:
+        return GoogleDriveFolderService(self.service)
+
+    @classmethod
+    def instance(cls) -> "ContributorDriveFacade":
+        global _DRIVE
+        drive = _DRIVE
+        if drive is None:
+            with _DRIVE_LOCK:
+                if _DRIVE is None:
+                    _DRIVE = cls()
+                drive = _DRIVE
+        return drive
+
+    @classmethod
+    def reset(cls) -> None:
+        global _DRIVE
+        with _DRIVE_LOCK:
+            _DRIVE = None
+        GoogleDriveAuthService.reset()
+
+    def category_root_id(self, folder_type: str) -> str:
+        root_id = self._category_roots.get(folder_type)
+        if root_id is None:
+            root_id = self.folder_service.get_category_root_id(folder_type)
+            self._category_roots[folder_type] = root_id
+        return root_id
+
+    def get_topic_files_for_chapter(
             self,
             contributor_id: int,
             course_id: int,
             chapter_number: int,
-            folder_type: str
-    ) -> List[dict]:
-
-        contributor_folder = f"{contributor_id}_{course_id}_{chapter_number}"
-
-        category_root_id = self.folder_service.get_or_create_folder(
-            settings.GOOGLE_DRIVE_FOLDERS[folder_type],
-            self.oer_root_id
-        )
-
-        query = (
-            "mimeType='application/vnd.google-apps.folder' "
-            f"and name='{contributor_folder}' "
-            f"and '{category_root_id}' in parents "
-            "and trashed=false"
-        )
-
-        result = (
-            self.service.files()
-            .list(q=query, fields="files(id, name)")
-            .execute()
-        )
+            folder_types: List[str]
+    ) -> Dict[str, List[dict]]:
+        """
+        Files under <type root>/<contributor folder>/<topic>/ for each folder
+        type, grouped by type. One listing per tree level (chapter folders,
+        topic folders, files) instead of one per type and per topic.
+        """
+        contributor_folder = drive_q_escape(f"{contributor_id}_{course_id}_{chapter_number}")
+        files_by_type: Dict[str, List[dict]] = {t: [] for t in folder_types}
+
+        roots = {self.category_root_id(t): t for t in folder_types}
+
+        # Level 1: the contributor's chapter folder in each category root
+        chapter_type: Dict[str, str] = {}
+        for folder in self._list_in_parents(
+            roots,
+            f"mimeType='{FOLDER_MIME}' and name='{contributor_folder}'",
+            "id, parents",
+        ):
+            folder_type = next(roots[p] for p in folder["parents"] if p in roots)
+            if folder_type not in chapter_type.values():
+                chapter_type[folder["id"]] = folder_type
+        if not chapter_type:
+            return files_by_type
+
+        # Level 2: topic folders
+        topics: Dict[str, tuple] = {}
+        for topic in self._list_in_parents(
+            chapter_type, f"mimeType='{FOLDER_MIME}'", "id, name, parents"
+        ):
+            parent = next(p for p in topic["parents"] if p in chapter_type)
+            topics[topic["id"]] = (topic["name"], chapter_type[parent])
+        if not topics:
+            return files_by_type
+
+        # Level 3: files inside the topic folders
+        for f in self._list_in_parents(topics, "", "id, name, mimeType, parents"):
+            topic_name, folder_type = topics[next(p for p in f["parents"] if p in topics)]
+            files_by_type[folder_type].append({
+                "id": f["id"],
+                "name": f["name"],
+                "mimeType": f["mimeType"],
+                "type": folder_type,
+                "topic": topic_name,
+            })
 
-        folders = result.get("files", [])
-        if not folders:
-            return []
+        return files_by_type
 
-        folder_id = folders[0]["id"]
+    def _list_in_parents(self, parent_ids, extra: str, fields: str) -> List[dict]:
+        """files.list over children of many parents, OR-ing parents into one query."""
+        parent_ids = list(parent_ids)
+        files: List[dict] = []
 
-        result = (
-            self.service.files()
-            .list(
-                q=f"'{folder_id}' in parents and trashed=false",
-                fields="files(id, name, mimeType)"
+        for i in range(0, len(parent_ids), self.PARENTS_PER_QUERY):
+            parents = " or ".join(
+                f"'{drive_q_escape(pid)}' in parents" for pid in parent_ids[i:i + self.PARENTS_PER_QUERY]
             )
-            .execute()
-        )
+            query = f"({parents}) and trashed=false"
+            if extra:
+                query += f" and {extra}"
+
+            page_token = None
+            while True:
+                result = (
+                    self.service.files()
+                    .list(
+                        q=query,
+                        fields=f"nextPageToken, files({fields})",
+                        pageSize=1000,
+                        pageToken=page_token,
+                    )
+                    .execute()
+                )
+                files.extend(result.get("files", []))
+                page_token = result.get("nextPageToken")
+                if not page_token:
+                    break
 
-        return [
-            {
-                "id": f["id"],
-                "name": f["name"],
-                "mimeType": f["mimeType"],
-                "type": folder_type,
-            }
-            for f in result.get("files", [])
-        ]
+        return files
 
 
 # ==============================
 # Topic Extraction Utility
 # ==============================
+_TOPIC_SPLIT_RE = re.compile(r"[;,.]")
+
+
 class TopicExtractor:
     @staticmethod
     def extract(description: str) -> List[str]:
         if not description:
             return []
         return [
-            t.strip()
-            for t in re.split(r"[;,.]", description)
-            if t.strip()
+            topic
+            for part in _TOPIC_SPLIT_RE.split(description)
+            if (topic := part.strip())
         ]
 
 
 from datetime import timedelta
+from django.db.models import Case, CharField, DateTimeField, IntegerField, Value, When
 from django.utils import timezone
 from accounts.models import ChapterContributionProgress, UploadCheck, ChapterPolicy, ContributorNote, BlockchainCertificate
 from itertools import chain
 
 @login_required
+@contributor_required
 def contributor_dashboard_view(request):
     user = request.user
 
-    if not ContributorAccessGuard.ensure_contributor(user):
-        return render(request, "403.html", status=403)
-
-    courses = ContributorCourseService.get_recommended_courses(user).select_related(
-        "scheme", "department", "department__program"
-    )
-
-    chapters_map = ContributorCourseService.get_chapters_by_course(courses, user)
+    courses, chapters_json = ContributorCourseService.get_dashboard_courses(user)
 
     # Build tasks
     now = timezone.now()
     soon_deadline = now + timedelta(days=2)
-
-    progress_qs = ChapterContributionProgress.objects.filter(contributor=user).select_related("chapter", "chapter__course")
-    submitted_chapter_ids = set(
-        UploadCheck.objects.filter(contributor=user).values_list("chapter_id", flat=True)
+    urgent_deadline = now + timedelta(hours=24)
+
+    # Both task sources share one column layout (annotations only, same order)
+    # so they can be UNION ALL'd and ordered / limited in SQL.
+    task_columns = (
+        "kind", "priority", "task_chapter_id", "task_course_id",
+        "task_chapter_number", "task_chapter_name", "files", "pdfs", "videos", "due_at",
+        "urgency", "urgency_text",
     )
 
-    tasks = []
-
-    # Task 1: Resume started chapters
-    for p in progress_qs:
-        if p.total_uploads > 0 and p.chapter_id not in submitted_chapter_ids:
-            tasks.append({
-                "type": "resume",
-                "title": f"Resume Chapter {p.chapter.chapter_number}: {p.chapter.chapter_name}",
-                "subtitle": (
-                    f"{p.total_uploads} file(s) uploaded • "
-                    f"PDF: {p.pdf_count} • Video: {p.video_count} • Not submitted yet"
-                ),
-                "chapter_id": p.chapter_id,
-                "course_id": p.chapter.course_id,
-                "priority": 2,
-            })
+    # Task 1: Resume started chapters (total_uploads is a model property,
+    # so the file count is annotated here)
+    resume_qs = (
+        ChapterContributionProgress.objects
+        .filter(contributor=user)
+        .exclude(chapter_id__in=UploadCheck.objects.filter(contributor=user).values("chapter_id"))
+        .annotate(
+            kind=Value("resume", output_field=CharField()),
+            priority=Value(2, output_field=IntegerField()),
+            task_chapter_id=F("chapter_id"),
+            task_course_id=F("chapter__course_id"),
+            task_chapter_number=F("chapter__chapter_number"),
+            task_chapter_name=F("chapter__chapter_name"),
+            files=F("pdf_count") + F("video_count"),
+            pdfs=F("pdf_count"),
+            videos=F("video_count"),
+            due_at=Value(None, output_field=DateTimeField()),
+            urgency=Value("", output_field=CharField()),
+            urgency_text=Value("", output_field=CharField()),
+        )
+        .filter(files__gt=0)
+        .values(*task_columns)
+    )
 
-    # Task 2: Deadline in 2 days
-    policies = ChapterPolicy.objects.filter(
-        chapter__course__in=courses,
-        current_deadline__isnull=False
-    ).select_related("chapter", "chapter__course")
+    # Task 2: Deadline in 2 days, chapter not yet submitted
+    deadline_qs = (
+        ChapterPolicy.objects.filter(
+            chapter__course_id__in=[course["id"] for course in courses],
+            current_deadline__gte=now,
+            current_deadline__lte=soon_deadline,
+        )
+        .annotate(
+            has_submission=Exists(
+                UploadCheck.objects.filter(contributor=user, chapter_id=OuterRef("chapter_id"))
+            )
+        )
+        .filter(has_submission=False)
+        .annotate(
+            kind=Value("deadline", output_field=CharField()),
+            priority=Value(1, output_field=IntegerField()),
+            task_chapter_id=F("chapter_id"),
+            task_course_id=F("chapter__course_id"),
+            task_chapter_number=F("chapter__chapter_number"),
+            task_chapter_name=F("chapter__chapter_name"),
+            files=Value(0, output_field=IntegerField()),
+            pdfs=Value(0, output_field=IntegerField()),
+            videos=Value(0, output_field=IntegerField()),
+            due_at=F("current_deadline"),
+            # urgency label
+            urgency=Case(
+                When(current_deadline__lte=urgent_deadline, then=Value("red")),
+                default=Value("orange"),
+                output_field=CharField(),
+            ),
+            urgency_text=Case(
+                When(current_deadline__lte=urgent_deadline, then=Value("URGENT • < 24h")),
+                default=Value("Soon • < 2 days"),
+                output_field=CharField(),
+            ),
+        )
+        .values(*task_columns)
+    )
 
-    for policy in policies:
-        deadline = policy.current_deadline or policy.deadline
-        if not deadline:
-            continue
-
-        if now <= deadline:
-            hours_left = (deadline - now).total_seconds() / 3600
-
-            # only show deadlines within 2 days in tasks
-            if hours_left <= 48:
-                if policy.chapter_id in submitted_chapter_ids:
-                    continue
-
-                # urgency label
-                if hours_left <= 24:
-                    urgency = "red"
-                    urgency_text = "URGENT • < 24h"
-                elif hours_left <= 48:
-                    urgency = "orange"
-                    urgency_text = "Soon • < 2 days"
-                else:
-                    urgency = "green"
-                    urgency_text = "On track"
-
-                tasks.append({
-                    "type": "deadline",
-                    "title": f"Deadline soon: Chapter {policy.chapter.chapter_number}: {policy.chapter.chapter_name}",
-                    "subtitle": f"Due on {deadline.strftime('%d %b %Y, %I:%M %p')}",
-                    "chapter_id": policy.chapter_id,
-                    "course_id": policy.chapter.course_id,
-                    "priority": 1,
-
-
-                    "urgency": urgency,
-                    "urgency_text": urgency_text,
-                })
-
-    # sort tasks by priority (deadline first)
-    tasks = sorted(tasks, key=lambda x: x["priority"])[:6]  # show max 6 tasks
+    # deadline first, show max 6 tasks
+    tasks = []
+    for t in resume_qs.union(deadline_qs, all=True).order_by("priority", "due_at")[:6]:
+        task = {
+            "type": t["kind"],
+            "chapter_id": t["task_chapter_id"],
+            "course_id": t["task_course_id"],
+            "priority": t["priority"],
+        }
+        if t["kind"] == "resume":
+            task["title"] = f"Resume Chapter {t['task_chapter_number']}: {t['task_chapter_name']}"
+            task["subtitle"] = (
+                f"{t['files']} file(s) uploaded • "
+                f"PDF: {t['pdfs']} • Video: {t['videos']} • Not submitted yet"
+            )
+        else:
+            task["title"] = f"Deadline soon: Chapter {t['task_chapter_number']}: {t['task_chapter_name']}"
+            task["subtitle"] = f"Due on {t['due_at'].strftime('%d %b %Y, %I:%M %p')}"
+            task["urgency"] = t["urgency"]
+            task["urgency_text"] = t["urgency_text"]
+        tasks.append(task)
 
     # ----------------------------
     # Recent Activity (last 3)
@@ -348,7 +521,11 @@ def contributor_dashboard_view(request):
     progress_latest = (
         ChapterContributionProgress.objects
         .filter(contributor=user, has_any_upload=True)
-        .select_related("chapter", "chapter__course")
+        .select_related("chapter")
+        .only(
+            "pdf_count", "video_count", "draft_count", "last_upload_at",
+            "chapter__chapter_number", "chapter__chapter_name",
+        )
         .order_by("-last_upload_at")[:3]
     )
 
@@ -367,19 +544,20 @@ def contributor_dashboard_view(request):
             "time": p.last_upload_at,
         })
 
-    recent_activity = sorted(recent_activity, key=lambda x: x["time"], reverse=True)[:3]
-
     notes = ContributorNote.objects.filter(contributor=user)[:5]
 
     # Fetch contributor certificates
-    certificates = BlockchainCertificate.objects.filter(
-        user=user,
-        certificate_type=BlockchainCertificate.CERT_TYPE_CONTRIBUTOR
+    certificates = (
+        BlockchainCertificate.objects
+        .filter(user=user, certificate_type=BlockchainCertificate.CERT_TYPE_CONTRIBUTOR)
+        # the cards show chapter / course names: join them instead of 2 queries per card
+        .select_related("chapter", "course")
+        .only("token_id", "issued_at", "chapter__chapter_name", "course__course_name")
     )
 
     context = {
         "recommended_courses": courses,
-        "chapters_json": json.dumps(chapters_map),
+        "chapters_json": chapters_json,
         "tasks": tasks,  # send tasks to template
         "recent_activity": recent_activity,
         "notes": notes,
@@ -389,119 +567,53 @@ def contributor_dashboard_view(request):
     return render(request, "contributor/contributor_dashboard.html", context)
 
 
-# @login_required
-# def contributor_submissions(request):
-#     user = request.user
-#
-#     if not ContributorAccessGuard.ensure_contributor(user):
-#         return render(request, "403.html", status=403)
-#
-#     uploads = ContributorSubmissionService.get_user_submissions(user)
-#
-#     context = {
-#         "uploads": uploads,
-#         "total_uploads": uploads.count(),
-#         "pending_count": uploads.filter(evaluation_status=False).count(),
-#         "evaluated_count": uploads.filter(evaluation_status=True).count(),
-#     }
-#
-#     return render(
-#         request,
-#         "contributor/contributor_submissions.html",
-#         context
-#     )
-
 @login_required
+@contributor_required
 def contributor_submissions(request):
     user = request.user
 
-    if not ContributorAccessGuard.ensure_contributor(user):
-        return render(request, "403.html", status=403)
-
-    uploads = ContributorSubmissionService.get_user_submissions(user)
-
-    service = GoogleDriveAuthService.get_service()
-    folder_service = GoogleDriveFolderService(service)
-    oer_root_id = folder_service.get_or_create_folder("oer_content")
-
-    uploads_with_files = []
-
-    for upload in uploads:
-        contributor_id = upload.contributor.id
-        course = upload.chapter.course
-        chapter = upload.chapter
+    page_obj = ContributorSubmissionService.get_user_submissions(user, request.GET.get("page"))
 
-        all_files = []
+    drive = ContributorDriveFacade.instance()
+    folder_types = ["pdf", "videos"]
 
-        def get_files_from_folder(folder_type):
-            folder_name = f"{contributor_id}_{course.id}_{chapter.chapter_number}"
-
-            root_folder_id = folder_service.get_or_create_folder(
-                settings.GOOGLE_DRIVE_FOLDERS[folder_type],
-                oer_root_id
-            )
-
-            query = (
-                "mimeType='application/vnd.google-apps.folder' "
-                f"and name='{folder_name}' "
-                f"and '{root_folder_id}' in parents "
-                "and trashed=false"
-            )
-
-            folders = service.files().list(
-                q=query,
-                fields="files(id, name)"
-            ).execute().get("files", [])
-
-            if not folders:
-                return []
-
-            chapter_folder_id = folders[0]["id"]
-
-            collected_files = []
+    def list_upload_files(upload):
+        files_by_type = drive.get_topic_files_for_chapter(
+            upload.contributor_id,
+            upload.chapter.course_id,
+            upload.chapter.chapter_number,
+            folder_types,
+        )
+        return files_by_type["pdf"] + files_by_type["videos"]
 
-            # STEP 1: Get topic folders
-            topic_folders = service.files().list(
-                q=(
-                    "mimeType='application/vnd.google-apps.folder' "
-                    f"and '{chapter_folder_id}' in parents "
-                    "and trashed=false"
-                ),
-                fields="files(id, name)"
-            ).execute().get("files", [])
-
-            for topic in topic_folders:
-                topic_id = topic["id"]
-                topic_name = topic["name"]
-
-                # STEP 2: Get files inside topic folder
-                files_result = service.files().list(
-                    q=f"'{topic_id}' in parents and trashed=false",
-                    fields="files(id, name, mimeType)"
-                ).execute()
-
-                for f in files_result.get("files", []):
-                    f["topic"] = topic_name
-                    collected_files.append(f)
-
-            return collected_files
-        for folder_type in ["pdf", "videos"]:
-            files = get_files_from_folder(folder_type)
-
-            for f in files:
-                f["type"] = folder_type
-                all_files.append(f)
-
-        uploads_with_files.append({
-            "upload": upload,
-            "files": all_files
-        })
+    try:
+        # Category roots may hit the DB / create folders: resolve them here,
+        # so the pool threads only issue Drive list calls.
+        for folder_type in folder_types:
+            drive.category_root_id(folder_type)
+
+        uploads = list(page_obj)
+        uploads_with_files = [
+            {"upload": upload, "files": files}
+            for upload, files in zip(uploads, _DRIVE_POOL.map(list_upload_files, uploads))
+        ]
+    except RefreshError:
+        # Drop the shared Drive client so the next request re-authenticates.
+        ContributorDriveFacade.reset()
+        raise
+
+    stats = UploadCheck.objects.filter(contributor=user).aggregate(
+        total=Count("id"),
+        pending=Count("id", filter=Q(evaluation_status=False)),
+        evaluated=Count("id", filter=Q(evaluation_status=True)),
+    )
 
     context = {
         "uploads_with_files": uploads_with_files,
-        "total_uploads": uploads.count(),
-        "pending_count": uploads.filter(evaluation_status=False).count(),
-        "evaluated_count": uploads.filter(evaluation_status=True).count(),
+        "page_obj": page_obj,
+        "total_uploads": stats["total"],
+        "pending_count": stats["pending"],
+        "evaluated_count": stats["evaluated"],
     }
 
     return render(
@@ -511,12 +623,10 @@ def contributor_submissions(request):
     )
 
 @login_required
+@contributor_required
 def contributor_profile(request):
     user = request.user
 
-    if not ContributorAccessGuard.ensure_contributor(user):
-        return render(request, "403.html", status=403)
-
     if request.method == "POST":
         user.designation = request.POST.get("designation", "").strip()
         user.current_institution = request.POST.get("current_institution", "").strip()
@@ -547,8 +657,7 @@ def contributor_submit_content_view(request, course_id=None, chapter_id=None):
     course_id = course_id or request.GET.get("course_id") or request.POST.get("course_id")
     chapter_id = chapter_id or request.GET.get("chapter_id") or request.POST.get("chapter_id")
 
-    print("Course:", course_id)
-    print("Chapter:", chapter_id)
+    logger.debug("Submit content | course=%s chapter=%s", course_id, chapter_id)
 
     if not course_id or not chapter_id:
         messages.error(request, "Invalid access. Please select a course & chapter.")
@@ -603,93 +712,21 @@ def contributor_submit_content_view(request, course_id=None, chapter_id=None):
     files = []
 
     try:
-        # Initialize Drive service (NEW AUTH CLASS)
-        service = GoogleDriveAuthService.get_service()
-        folder_service = GoogleDriveFolderService(service)
-
-        oer_root_id = folder_service.get_or_create_folder("oer_content")
-
-        def get_files_from_folder(folder_type):
-            folder_name = f"{contributor_id}_{course.id}_{chapter.chapter_number}"
-
-            root_folder_id = folder_service.get_or_create_folder(
-                settings.GOOGLE_DRIVE_FOLDERS[folder_type],
-                oer_root_id
-            )
-
-            # Contributor chapter folder
-            query = (
-                "mimeType='application/vnd.google-apps.folder' "
-                f"and name='{folder_name}' "
-                f"and '{root_folder_id}' in parents "
-                "and trashed=false"
-            )
-
-            folders = (
-                service.files()
-                .list(q=query, fields="files(id, name)")
-                .execute()
-                .get("files", [])
-            )
-
-            collected_files = []
-
-            if not folders:
-                return collected_files
-
-            chapter_folder_id = folders[0]["id"]
-
-            # STEP 1: Fetch topic folders
-            topic_folders = (
-                service.files()
-                .list(
-                    q=(
-                        "mimeType='application/vnd.google-apps.folder' "
-                        f"and '{chapter_folder_id}' in parents "
-                        "and trashed=false"
-                    ),
-                    fields="files(id, name)"
-                )
-                .execute()
-                .get("files", [])
-            )
-
-            for topic in topic_folders:
-                topic_id = topic["id"]
-                topic_name = topic["name"]
-
-                print(f"📂 TOPIC FOLDER: {topic_name}")
-
-                # STEP 2: Fetch actual files inside topic folder
-                files_result = (
-                    service.files()
-                    .list(
-                        q=f"'{topic_id}' in parents and trashed=false",
-                        fields="files(id, name, mimeType)"
-                    )
-                    .execute()
-                )
-
-                for f in files_result.get("files", []):
-                    print(f"📄 FILE FOUND: {f['name']} (inside {topic_name})")
-
-                    collected_files.append({
-                        "id": f["id"],
-                        "name": f["name"],
-                        "mimeType": f["mimeType"],
-                        "type": folder_type,
-                        "topic": topic_name,
-                    })
-
-            return collected_files
-
+        # Shared Drive service + cached folder ids
+        drive = ContributorDriveFacade.instance()
 
         # Aggregate files
-        for folder_type in ["drafts", "pdf", "videos", "assessments"]:
-            files.extend(get_files_from_folder(folder_type))
+        files_by_type = drive.get_topic_files_for_chapter(
+            contributor_id,
+            course.id,
+            chapter.chapter_number,
+            ["drafts", "pdf", "videos", "assessments"],
+        )
+        files = list(chain.from_iterable(files_by_type.values()))
 
     except RefreshError as e:
-        print("[ERROR] Google token invalid:", e)
+        logger.warning("Google token invalid: %s", e)
+        ContributorDriveFacade.reset()
 
         token_path = settings.GOOGLE_TOKEN_FILE
         if os.path.exists(token_path):
@@ -702,13 +739,12 @@ def contributor_submit_content_view(request, course_id=None, chapter_id=None):
         return redirect("contributor_dashboard")
 
     except Exception as e:
-        print("[ERROR] Unexpected Drive issue:", e)
+        logger.exception("Unexpected Drive issue")
         messages.error(request, f"An unexpected error occurred: {e}")
         files = []
 
     # ---- Topic extraction ----
-    raw_desc = chapter.description or ""
-    topics = [t.strip() for t in re.split(r"[;,.]", raw_desc) if t.strip()]
+    topics = TopicExtractor.extract(chapter.description)
 
     context = {
         "course": course,
@@ -721,57 +757,117 @@ def contributor_submit_content_view(request, course_id=None, chapter_id=None):
     return render(request, "contributor/submit_content.html", context)
 
 
-from django.views.decorators.csrf import csrf_exempt
+from django.db import transaction
+from django.views.decorators.http import require_POST
 from accounts.models import ContributorNote
 
-@csrf_exempt
-@login_required
-def add_note(request):
 
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
+NOTE_TITLE_MAX_LENGTH = ContributorNote._meta.get_field("title").max_length
 
-    title = request.POST.get("title", "").strip()
-    content = request.POST.get("content", "").strip()
 
-    # allow empty note creation
-    note = ContributorNote.objects.create(
-        contributor=request.user,
-        title=title,
-        content=content or ""
-    )
+def _note_text(value, field):
+    """Stripped note title / content; null means empty, anything but a string is rejected."""
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    value = value.strip()
+    if field == "title" and len(value) > NOTE_TITLE_MAX_LENGTH:
+        raise ValueError(f"title is longer than {NOTE_TITLE_MAX_LENGTH} characters")
+    return value
 
-    return JsonResponse({
-        "success": True,
-        "id": note.id
-    })
 
+def _note_id(value):
+    # bool is an int subclass, but true / false are not note ids
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError("note ids must be integers")
+    return int(value)
 
-@csrf_exempt
-@login_required
-def edit_note(request, note_id):
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
 
-    note = get_object_or_404(ContributorNote, id=note_id, contributor=request.user)
+def _json_list(payload, key):
+    items = payload.get(key, [])
+    if not isinstance(items, list):
+        raise ValueError(f"{key} must be a list")
+    return items
 
-    note.title = request.POST.get("title", "").strip()
-    note.content = request.POST.get("content", "").strip()
-    note.save()
 
-    return JsonResponse({"success": True})
+def _parse_notes_payload(body):
+    """
+    (creates, updates, delete_ids) from a notes_batch body, with every value
+    type-checked; raises ValueError (message safe to return) when malformed.
+    """
+    payload = _json_loads(body or b"{}")
+    if not isinstance(payload, dict):
+        raise ValueError("body must be a JSON object")
+
+    creates = []
+    for item in _json_list(payload, "creates"):
+        if not isinstance(item, dict):
+            raise ValueError("creates items must be objects")
+        creates.append((
+            _note_text(item.get("title"), "title"),
+            _note_text(item.get("content"), "content"),
+        ))
+
+    updates = {}
+    for item in _json_list(payload, "updates"):
+        if not isinstance(item, dict) or "id" not in item:
+            raise ValueError("updates items must be objects with an id")
+        updates[_note_id(item["id"])] = {
+            field: _note_text(item[field], field)
+            for field in ("title", "content")
+            if field in item
+        }
+
+    delete_ids = {_note_id(i) for i in _json_list(payload, "deletes")}
+    return creates, updates, delete_ids
 
 
-@csrf_exempt
 @login_required
-def delete_note(request, note_id):
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
+@require_POST
+def notes_batch(request):
+    """
+    Apply sticky-note changes from one JSON body (CSRF-protected):
+      {"creates": [{"title", "content"}], "updates": [{"id", "title"?, "content"?}], "deletes": [id, ...]}
+    """
+    try:
+        creates, updates, delete_ids = _parse_notes_payload(request.body)
+    except ValueError as e:
+        return JsonResponse({"error": f"Invalid payload: {e}"}, status=400)
+
+    user = request.user
+
+    with transaction.atomic():
+        deleted = 0
+        if delete_ids:
+            deleted, _ = ContributorNote.objects.filter(id__in=delete_ids, contributor=user).delete()
 
-    note = get_object_or_404(ContributorNote, id=note_id, contributor=request.user)
-    note.delete()
+        notes = list(
+            ContributorNote.objects.filter(
+                id__in=[i for i in updates if i not in delete_ids], contributor=user
+            )
+        )
+        if notes:
+            now = timezone.now()
+            fields = {"updated_at"}
+            for note in notes:
+                for field, value in updates[note.id].items():
+                    setattr(note, field, value)
+                    fields.add(field)
+                note.updated_at = now  # auto_now isn't applied by bulk_update
+            ContributorNote.objects.bulk_update(notes, sorted(fields))
+
+        created = ContributorNote.objects.bulk_create([
+            ContributorNote(contributor=user, title=title, content=content)
+            for title, content in creates
+        ])
 
-    return JsonResponse({"success": True})
+    return JsonResponse({
+        "success": True,
+        "created": [note.id for note in created],
+        "updated": len(notes),
+        "deleted": deleted,
+    })
 
 @login_required
 def get_note(request, note_id):
@@ -5,32 +5,47 @@ from accounts.models import Expertise, Course
 
 STOP_WORDS = {"and", "or", "the", "of", "to", "in", "for"}
 
+_TOKEN_SPLIT_RE = re.compile(r"[,\s;/\-]+")
+
 
 def tokenize(text: str):
     text = (text or "").lower().strip()
-    words = re.split(r"[,\s;/\-]+", text)
-    words = [w for w in words if w and w not in STOP_WORDS and len(w) >= 3]
-    return list(set(words))  # unique
+    # len >= 3 also drops the empty strings split leaves at the edges
+    return {w for w in _TOKEN_SPLIT_RE.split(text) if len(w) >= 3 and w not in STOP_WORDS}
 
 
-def auto_link_expertise_to_courses(expertise_obj: Expertise):
+def auto_link_expertises_to_courses(expertises):
     """
-    fills accounts_expertise_courses automatically
+    fills accounts_expertise_courses automatically for many expertises at
+    once: one course query for the union of their keywords and one bulk
+    insert of links, instead of a query + add() per expertise.
     """
-
-    keywords = tokenize(expertise_obj.name)
-    if not keywords:
-        return []
-
-    q = Q()
-    for word in keywords:
-        q |= Q(course_name__icontains=word)
-        q |= Q(course_code__icontains=word)
-
-    matched_courses = Course.objects.filter(q).distinct()
-
-    # attach in expertise_courses table
-    if matched_courses.exists():
-        expertise_obj.courses.add(*matched_courses)
-
-    return list(matched_courses)
+    keywords_by_expertise = {}
+    for exp in expertises:
+        keywords = tokenize(exp.name)
+        if keywords:
+            keywords_by_expertise[exp.pk] = keywords
+    if not keywords_by_expertise:
+        return
+
+    all_keywords = set().union(*keywords_by_expertise.values())
+    pattern = "|".join(re.escape(word) for word in sorted(all_keywords))
+    candidates = list(
+        Course.objects
+        .filter(Q(course_name__iregex=pattern) | Q(course_code__iregex=pattern))
+        .values_list("id", "course_name", "course_code")
+    )
+
+    through = Expertise.courses.through
+    links = []
+    for expertise_id, keywords in keywords_by_expertise.items():
+        # same escaped alternation, applied per expertise to the fetched rows
+        matcher = re.compile("|".join(re.escape(word) for word in keywords), re.IGNORECASE)
+        links.extend(
+            through(expertise_id=expertise_id, course_id=course_id)
+            for course_id, name, code in candidates
+            if matcher.search(name) or matcher.search(code)
+        )
+
+    # attach in expertise_courses table (existing links are skipped)
+    through.objects.bulk_create(links, ignore_conflicts=True)
@@ -1,4 +1,5 @@
 import json
+import re
 from typing import List
 from accounts.models import Expertise
 
@@ -38,24 +39,42 @@ def save_user_expertise(user, raw_expertise: str):
     # remove old expertise relations
     user.domain_of_expertise.clear()
 
+    wanted = {}  # lower-cased name -> name as typed (first spelling wins)
     for name in names:
-        if not name:
-            continue
-
         name = name.strip()
+        if name:
+            wanted.setdefault(name.lower(), name)
+    if not wanted:
+        return names
 
-        # 1) exact match
-        exp_obj = Expertise.objects.filter(name__iexact=name).first()
+    # one alternation covers both lookups: an exact hit or any name containing
+    # the tag; ordered by pk so the partial fallback matches .first()
+    pattern = "|".join(re.escape(key) for key in wanted)
+    candidates = list(Expertise.objects.filter(name__iregex=pattern).order_by("pk"))
 
+    matched = {}
+    for key in wanted:
+        # 1) exact match
+        exp_obj = next((e for e in candidates if e.name.lower() == key), None)
         # 2) partial match
-        if not exp_obj:
-            exp_obj = Expertise.objects.filter(name__icontains=name).first()
+        if exp_obj is None:
+            exp_obj = next((e for e in candidates if key in e.name.lower()), None)
+        if exp_obj is not None:
+            matched[exp_obj.pk] = exp_obj
 
-        # 3) create new if nothing matched
-        if not exp_obj:
-            exp_obj = Expertise.objects.create(name=name)
+    # 3) create new if nothing matched
+    missing = [
+        name for key, name in wanted.items()
+        if not any(key in e.name.lower() for e in candidates)
+    ]
+    if missing:
+        Expertise.objects.bulk_create(
+            [Expertise(name=name) for name in missing], ignore_conflicts=True
+        )
+        for exp_obj in Expertise.objects.filter(name__in=missing):
+            matched[exp_obj.pk] = exp_obj
 
-        # create row in accounts_user_domain_of_expertise
-        user.domain_of_expertise.add(exp_obj)
+    # create rows in accounts_user_domain_of_expertise
+    user.domain_of_expertise.add(*matched.values())
 
     return names
@@ -79,9 +79,10 @@
 
 
 
-from ...models import Program, Course, Expertise
-from sentence_transformers import SentenceTransformer, util
+from ...models import Program, Course, CourseEmbedding, Expertise
+from ...services import embeddings
 from sklearn.cluster import AgglomerativeClustering
+import hashlib
 import numpy as np
 import re
 
@@ -91,18 +92,69 @@ def clean_title(title: str):
     title = re.sub(r"\s+", " ", title).strip()
     return title.title()
 
+def encode_course_texts(courses, course_texts):
+    """
+    Normalized embeddings for course_texts (one per course), persisted in
+    CourseEmbedding. Rows whose text hash and model still match are reused,
+    so only new or edited courses go through the model on a re-run.
+    """
+    hashes = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in course_texts]
+    stored = {
+        row.course_id: row
+        for row in CourseEmbedding.objects.filter(course__in=courses)
+    }
+
+    vectors = [None] * len(courses)
+    missing = []
+    for i, (course, text_hash) in enumerate(zip(courses, hashes)):
+        row = stored.get(course.id)
+        if row and row.text_hash == text_hash and row.model_name == embeddings.MODEL_NAME:
+            vectors[i] = np.frombuffer(bytes(row.vector), dtype=np.float32)
+        else:
+            missing.append(i)
+
+    if missing:
+        fresh = embeddings.get_model().encode(
+            [course_texts[i] for i in missing],
+            batch_size=64,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        ).astype(np.float32)
+        CourseEmbedding.objects.bulk_create(
+            [
+                CourseEmbedding(
+                    course=courses[i],
+                    model_name=embeddings.MODEL_NAME,
+                    text_hash=hashes[i],
+                    vector=emb.tobytes(),
+                )
+                for i, emb in zip(missing, fresh)
+            ],
+            update_conflicts=True,
+            unique_fields=["course"],
+            update_fields=["model_name", "text_hash", "vector", "updated_at"],
+        )
+        for i, emb in zip(missing, fresh):
+            vectors[i] = emb
+
+    return np.vstack(vectors)
+
 def generate_expertise(min_courses=3, similarity_threshold=0.45):
     """
     Generate program-wise expertise clusters using semantic similarity of
     course names + objectives + outcomes.
     """
     print("Starting smart expertise generation...")
-    model = SentenceTransformer('all-MiniLM-L6-v2')
 
     for program in Program.objects.all():
         print(f"\n🔹 Processing Program: {program.program_name}")
 
-        courses = list(Course.objects.filter(department__program=program))
+        courses = list(
+            Course.objects
+            .filter(department__program=program)
+            .prefetch_related("objectives", "outcomes")
+        )
         if len(courses) < min_courses:
             print(f"Skipping {program.program_name}: Not enough courses")
             continue
@@ -115,7 +167,7 @@ def generate_expertise(min_courses=3, similarity_threshold=0.45):
             full_text = f"{c.course_name}. {objectives_text}. {outcomes_text}"
             course_texts.append(full_text.strip())
 
-        embeddings = model.encode(course_texts, normalize_embeddings=True)
+        course_embeddings = encode_course_texts(courses, course_texts)
 
         # Agglomerative clustering
         clustering = AgglomerativeClustering(
@@ -124,7 +176,7 @@ def generate_expertise(min_courses=3, similarity_threshold=0.45):
             affinity='cosine',
             linkage='average'
         )
-        labels = clustering.fit_predict(embeddings)
+        labels = clustering.fit_predict(course_embeddings)
 
         # Clear old expertises
         Expertise.objects.filter(program=program).delete()
@@ -133,17 +185,19 @@ def generate_expertise(min_courses=3, similarity_threshold=0.45):
         for label, course in zip(labels, courses):
             clusters.setdefault(label, []).append(course)
 
+        labels_arr = np.asarray(labels)
+
         # Create Expertise objects for each cluster
         for i, (label, grouped_courses) in enumerate(clusters.items(), start=1):
             if not grouped_courses:
                 continue
 
-            # Representative course for naming
-            idxs = [courses.index(c) for c in grouped_courses]
-            cluster_embs = embeddings[idxs]
-            centroid = np.mean(cluster_embs, axis=0)
-            sims = util.cos_sim(centroid, cluster_embs)[0]
-            rep_idx = int(np.argmax(sims))
+            # Representative course for naming: embeddings are L2-normalized,
+            # so cosine to the (normalized) centroid is a plain dot product
+            cluster_embs = course_embeddings[labels_arr == label]
+            centroid = cluster_embs.mean(axis=0)
+            centroid /= np.linalg.norm(centroid)
+            rep_idx = int((cluster_embs @ centroid).argmax())
             rep_course = grouped_courses[rep_idx]
 
             rep_name = clean_title(rep_course.course_name)
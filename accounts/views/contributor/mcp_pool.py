@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import anyio
+from mcp.client.session import ClientSession
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.types import CallToolResult
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class McpSessionPool:
+    """
+    One long-lived MCP stdio session, shared by every evaluation in the process.
+
+    The server subprocess is spawned and initialized on first use inside a
+    dedicated event-loop thread (the session's streams belong to that loop).
+    Callers on any loop use call_tool() like ClientSession.call_tool: only the
+    tool call itself runs on the session's loop, the caller's own work stays
+    on its loop. If the server goes away (its streams close), the next call
+    starts a fresh one.
+    """
+
+    #: errors meaning the server side is gone, not that the work itself failed
+    DISCONNECTED = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+    def __init__(self, server_params: Callable[[], StdioServerParameters]):
+        self._server_params = server_params
+        self._lock = threading.Lock()
+        self._ready = None  # Future[(loop, session, stop event)] of the live server
+
+    async def call_tool(self, name: str, arguments: Optional[dict] = None, **kwargs) -> CallToolResult:
+        return await self._run(lambda session: session.call_tool(name, arguments, **kwargs))
+
+    async def _run(self, fn: Callable[[ClientSession], Awaitable[T]]) -> T:
+        """Run fn(session) on the session's loop and return its result."""
+        ready = self._ensure_started()
+        loop, session, stop = await asyncio.wrap_future(ready)
+        try:
+            return await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(fn(session), loop)
+            )
+        except self.DISCONNECTED:
+            self._discard(ready)
+            loop.call_soon_threadsafe(stop.set)
+            raise
+
+    def _ensure_started(self) -> Future:
+        with self._lock:
+            if self._ready is None:
+                self._ready = Future()
+                threading.Thread(
+                    target=self._thread_main, args=(self._ready,),
+                    name="mcp-session", daemon=True,
+                ).start()
+            return self._ready
+
+    def _discard(self, ready: Future):
+        with self._lock:
+            if self._ready is ready:
+                self._ready = None
+
+    def _thread_main(self, ready: Future):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._serve(ready))
+        finally:
+            loop.close()
+
+    async def _serve(self, ready: Future):
+        try:
+            async with stdio_client(self._server_params()) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    logger.info("MCP session initialized")
+                    stop = asyncio.Event()
+                    ready.set_result((asyncio.get_running_loop(), session, stop))
+                    # serve run() calls until a caller reports the server gone
+                    await stop.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            logger.exception("MCP session stopped")
+        finally:
+            self._discard(ready)
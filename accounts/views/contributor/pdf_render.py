@@ -0,0 +1,118 @@
+"""
+HTML -> PDF rendering for the editor and PDF text extraction for assessments,
+run in worker processes.
+
+xhtml2pdf and PyPDF2 are pure Python and CPU-bound, so running them in a
+process pool keeps them off the request thread (and the GIL). Workers are
+started with "spawn", not fork: the web process already runs several thread
+pools, and a forked child can inherit a lock another thread was holding.
+This module imports nothing from Django so spawned workers can load it
+without app setup.
+"""
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from PyPDF2 import PdfReader
+from xhtml2pdf import pisa
+
+RENDER_TIMEOUT = 60  # seconds
+EXTRACT_TIMEOUT = 120  # seconds, per PDF
+
+# pages per extraction task: each task re-parses the PDF, so small ranges
+# only pay off for long documents
+PAGES_PER_TASK = 8
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def render_pdf(content: str) -> Optional[bytes]:
+    """PDF bytes for the HTML content, or None if xhtml2pdf reports errors."""
+    pdf_io = io.BytesIO()
+    result = pisa.CreatePDF(io.StringIO(content), dest=pdf_io)
+    if result.err:
+        return None
+    return pdf_io.getvalue()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def render_pdf_in_pool(content: str) -> Optional[bytes]:
+    return _get_pool().submit(render_pdf, content).result(timeout=RENDER_TIMEOUT)
+
+
+def count_pages(pdf_path: str) -> int:
+    return len(PdfReader(pdf_path).pages)
+
+
+def extract_text_pages(pdf_path: str, start: int, stop: int, limit: Optional[int] = None) -> str:
+    """
+    Text of pages [start, stop) (clamped to the page count) joined by
+    newlines. With a limit, stops after the page that brings the text to
+    ``limit`` characters.
+    """
+    reader = PdfReader(pdf_path)
+    texts = []
+    total = 0
+    for i in range(start, min(stop, len(reader.pages))):
+        text = reader.pages[i].extract_text() or ""
+        texts.append(text)
+        total += len(text) + 1
+        if limit is not None and total >= limit:
+            break
+    return "\n".join(texts)
+
+
+def extract_pdf_text_in_pool(pdf_bytes: bytes, limit: Optional[int] = None) -> str:
+    """
+    Text of every page, extracted in page ranges across the pool, in page
+    order. With a limit, ranges past the first ``limit`` characters are
+    cancelled (or their text dropped if already running).
+
+    The PDF is written to a temporary file once and the workers read it from
+    there, so the bytes are not pickled into every task; the page count is
+    read in a worker, alongside the first range.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+        pdf_file.write(pdf_bytes)
+        pdf_file.flush()
+        path = pdf_file.name
+
+        pool = _get_pool()
+        page_count_future = pool.submit(count_pages, path)
+        futures = [pool.submit(extract_text_pages, path, 0, PAGES_PER_TASK, limit)]
+        page_count = page_count_future.result(timeout=EXTRACT_TIMEOUT)
+        futures += [
+            pool.submit(extract_text_pages, path, start, start + PAGES_PER_TASK, limit)
+            for start in range(PAGES_PER_TASK, page_count, PAGES_PER_TASK)
+        ]
+
+        texts = []
+        total = 0
+        try:
+            for future in futures:
+                text = future.result(timeout=EXTRACT_TIMEOUT)
+                texts.append(text)
+                total += len(text) + 1
+                if limit is not None and total >= limit:
+                    break
+        finally:
+            # ranges not needed (or left behind by an error) must not start
+            # after the file is gone
+            for pending in futures:
+                pending.cancel()
+        return "\n".join(texts)
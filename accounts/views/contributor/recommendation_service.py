@@ -1,5 +1,4 @@
-from accounts.models import Course
-from accounts.views.contributor.course_linking_service import auto_link_expertise_to_courses
+from accounts.views.contributor.course_linking_service import auto_link_expertises_to_courses
 from accounts.views.contributor.expertise_service import save_user_expertise
 
 
@@ -11,16 +10,7 @@ def save_expertise_and_generate_course_links(user, raw_expertise: str):
     """
     names = save_user_expertise(user, raw_expertise)
 
-    for exp in user.domain_of_expertise.all():
-        auto_link_expertise_to_courses(exp)
+    auto_link_expertises_to_courses(user.domain_of_expertise.only("id", "name"))
 
     return names
 
-
-def recommend_courses_for_contributor(user):
-    """
-    will work ONLY after expertise->courses mapping exists
-    """
-    return Course.objects.filter(
-        expertises__in=user.domain_of_expertise.all()
-    ).distinct()
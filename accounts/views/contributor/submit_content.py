@@ -1,61 +1,109 @@
 import asyncio
 import io
 import json
+import logging
 import os
 import tempfile
-import threading
 import urllib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 import re
 from typing import List, Dict
 from django.urls import reverse
 from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
 from django.contrib.admin.utils import unquote
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse, HttpResponseBadRequest
+from django.http import HttpResponse, JsonResponse, HttpResponseBadRequest
 from django.contrib import messages
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 
-from PyPDF2 import PdfReader
 from docx import Document
 from exceptiongroup import ExceptionGroup
 from google.auth.exceptions import RefreshError
 from langchain_core.messages import HumanMessage
 from langsmith import traceable
-from xhtml2pdf import pisa
 from googleapiclient.http import (
     MediaFileUpload,
-    MediaIoBaseUpload,
     MediaIoBaseDownload
 )
 
 from accounts.models import (
-    Chapter, UploadCheck, Assessment,
+    Chapter, UploadCheck, Assessment, AssessmentJob,
     Question, Option, Course, User, ExternalResource, ChapterContributionProgress, ChapterPolicy, AssessmentSource,
     EvaluationRun, ContentScore
 )
+from accounts.services import dashboard_cache
 from accounts.views.email.email_service import ContributionSuccessEmail
 from langgraph_agents.review_graph.review_runner import run_review_pipeline
 
 from langgraph_agents.services.drive_service import (
     GoogleDriveAuthService,
-    GoogleDriveFolderService
+    GoogleDriveFolderService,
+    FOLDER_QUERY,
+    create_file,
+    drive_q_escape,
+    get_file_names,
+    list_files,
+    media_upload,
 )
 
 from langgraph_agents.agents.submission_agent import submission_agent
+from langgraph_agents.services.extraction_events import wait_for_extraction_done
 from langgraph_agents.graph.workflow import compiled_graph
 from langgraph_agents.services.evaluation_score import finalize_evaluation
 from langgraph_agents.services.gemini_service import llm
 
-import traceback
 import sys
 
 from asgiref.sync import sync_to_async
-from mcp.client.session import ClientSession
-from mcp.client.stdio import stdio_client, StdioServerParameters
+from mcp.client.stdio import StdioServerParameters
 
-from accounts.models import ContentCheck
+from accounts.views.contributor import chat_cache
+from accounts.views.contributor.mcp_pool import McpSessionPool
+from accounts.views.contributor.pdf_render import extract_pdf_text_in_pool, render_pdf_in_pool
 
+try:  # libuv-based loop where available (not on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    _json_loads = json.loads
+
+_TOPIC_SPLIT_RE = re.compile(r"[;,.]")
+
+# ```json ... ``` fence Gemini sometimes wraps its JSON replies in
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.DOTALL)
+
+# characters of PDF text sent to Gemini when generating an assessment
+SOURCE_TEXT_LIMIT = 15000
+
+# Drive I/O fan-out for the upload page (listing, uploads); threads hold their
+# own Drive clients (GoogleDriveAuthService caches one per thread)
+_DRIVE_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="submit-content-drive")
+
+# background evaluations (wait for extraction, graph runs, scoring)
+_EVALUATION_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="evaluation")
+
+# assessment generation (PDF download + extraction, Gemini call, inserts);
+# the view returns a job id and the page polls generate_assessment_status
+_ASSESSMENT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="assessment")
+ASSESSMENT_JOB_TIMEOUT = timedelta(minutes=15)
+ASSESSMENT_JOB_RETENTION = timedelta(days=1)
+
+
+def new_event_loop():
+    return uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
 
 # PROJECT_ROOT = r"C:\Users\gauri\IdeaProjects\oer"
 # MCP_PATH = os.path.join(PROJECT_ROOT, "langgraph_agents", "services", "mcp_server.py")
@@ -65,19 +113,44 @@ PROJECT_ROOT = str(settings.BASE_DIR)
 # MCP server path from project root
 MCP_PATH = os.path.join(PROJECT_ROOT, "langgraph_agents", "services", "mcp_server.py")
 
+
+def mcp_server_params():
+    assert os.path.exists(MCP_PATH), f"MCP_PATH missing: {MCP_PATH}"
+
+    return StdioServerParameters(
+        command=sys.executable,
+        args=[MCP_PATH],
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "oer.settings",
+            "PYTHONPATH": PROJECT_ROOT,
+        }
+    )
+
+
+# one MCP server process for all evaluations (started on first use)
+mcp_pool = McpSessionPool(mcp_server_params)
+
 def get_chapter_storage_usage(service, folder_id):
 
-    total_size = 0
+    return sum(
+        int(f.get("size", 0))
+        for f in list_files(service, f"'{folder_id}' in parents and trashed=false", "size")
+    )
+
 
-    results = service.files().list(
-        q=f"'{folder_id}' in parents and trashed=false",
-        fields="files(size)"
-    ).execute()
+def download_drive_file(file_id):
+    """Download a Drive file into memory with the calling thread's client."""
+    service = GoogleDriveAuthService.get_service()
+    file_io = io.BytesIO()
+    downloader = MediaIoBaseDownload(file_io, service.files().get_media(fileId=file_id))
 
-    for f in results.get("files", []):
-        total_size += int(f.get("size", 0))
+    done = False
+    while not done:
+        _, done = downloader.next_chunk()
 
-    return total_size
+    file_io.seek(0)
+    return file_io
 
 
 class ContributorSessionService:
@@ -104,13 +177,10 @@ class ContributorDriveUploadService:
     def __init__(self):
         self.service = GoogleDriveAuthService.get_service()
         self.folder_service = GoogleDriveFolderService(self.service)
-        self.oer_root_id = self.folder_service.get_or_create_folder("oer_content")
+        self.oer_root_id = self.folder_service.get_oer_root_id()
 
     def ensure_topic_folder(self, base_folder, folder_type, topic=None):
-        root = self.folder_service.get_or_create_folder(
-            settings.GOOGLE_DRIVE_FOLDERS[folder_type],
-            self.oer_root_id
-        )
+        root = self.folder_service.get_category_root_id(folder_type)
         contributor_folder = self.folder_service.get_or_create_folder(
             base_folder, root
         )
@@ -119,39 +189,29 @@ class ContributorDriveUploadService:
             return self.folder_service.get_or_create_folder(topic, contributor_folder)
         return contributor_folder
 
-    def upload_file_bytes(self, file_bytes, filename, folder_id, content_type, contributor_id):
-        buffer = io.BytesIO(file_bytes)
-        media = MediaIoBaseUpload(
-            buffer,
-            mimetype=content_type,
-            resumable=True
-        )
+    def upload_file_stream(self, fileobj, filename, folder_id, content_type, size):
+        """Safe to call from pool threads: uses the calling thread's Drive client."""
+        # large uploads are read from the (spooled) file in chunks, not buffered whole
+        media = media_upload(fileobj, content_type, size)
 
         file_metadata = {
             "name": filename,
             "parents": [folder_id]
         }
 
-        self.service.files().create(
-            body=file_metadata,
-            media_body=media,
-            fields="id"
-        ).execute()
-
-        # after upload
-        buffer.close()
+        create_file(GoogleDriveAuthService.get_service(), file_metadata, media)
 
 
 class ContributorEditorService:
     def __init__(self):
         self.service = GoogleDriveAuthService.get_service()
         self.folder_service = GoogleDriveFolderService(self.service)
-        self.oer_root = self.folder_service.get_or_create_folder("oer_content")
+        self.oer_root = self.folder_service.get_oer_root_id()
 
     def save_draft(self, content, filename, folder_id):
         doc = Document()
         from bs4 import BeautifulSoup
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, "lxml")
         for p in soup.find_all(["p", "div"]):
             if p.text.strip():
                 doc.add_paragraph(p.text.strip())
@@ -160,16 +220,13 @@ class ContributorEditorService:
         doc.save(bio)
         bio.seek(0)
 
-        media = MediaIoBaseUpload(
+        media = media_upload(
             bio,
-            mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            bio.getbuffer().nbytes,
         )
 
-        self.service.files().create(
-            body={'name': filename, 'parents': [folder_id]},
-            media_body=media,
-            fields="id"
-        ).execute()
+        create_file(self.service, {'name': filename, 'parents': [folder_id]}, media)
 
 
 class SubmissionOrchestrator:
@@ -177,8 +234,10 @@ class SubmissionOrchestrator:
     @traceable(name="Submission + Evaluation Orchestrator")
     def submit_and_evaluate(state: dict):
 
-        # 1) submission agent sync safe
-        loop = asyncio.new_event_loop()
+        # 1) submission agent sync safe. The same loop is handed to the
+        # evaluation thread afterwards (it is idle by then), so each
+        # submission creates and closes one loop, not two.
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             result = loop.run_until_complete(
@@ -188,42 +247,33 @@ class SubmissionOrchestrator:
                     "drive_folders": state["drive_folders"],
                 })
             )
-            print("Submission agent invoked!!")
-        finally:
+            logger.debug("Submission agent invoked")
+        except BaseException:
             loop.close()
+            raise
+        finally:
+            asyncio.set_event_loop(None)
 
         if result.get("status") != "success":
+            loop.close()
             return result
 
         upload_id = result["upload_id"]
 
         # 2) evaluation graph in background thread
         def run_graph_background():
-            bg_loop = asyncio.new_event_loop()
+            bg_loop = loop
             asyncio.set_event_loop(bg_loop)
 
             async def wait_for_extraction():
                 max_wait_seconds = 300
-                interval = 5
-                waited = 0
-
-                while waited < max_wait_seconds:
-                    status = await sync_to_async(
-                        lambda: ContentCheck.objects.filter(upload_id=upload_id)
-                        .values_list("extraction_status", flat=True)
-                        .first()
-                    )()
 
-                    print("🔎 extraction_status =", status)
+                # the extraction thread signals this upload when it is done
+                if await wait_for_extraction_done(upload_id, timeout=max_wait_seconds):
+                    logger.info("Extraction confirmed for upload %s. Starting evaluation graph", upload_id)
+                    return True
 
-                    if status is True:
-                        print("Extraction confirmed. Starting evaluation graph...")
-                        return True
-
-                    await asyncio.sleep(interval)
-                    waited += interval
-
-                print("Extraction timeout. Evaluation graph NOT started.")
+                logger.warning("Extraction timeout for upload %s. Evaluation graph NOT started", upload_id)
                 return False
 
             @traceable(name="Evaluation Pipeline")
@@ -232,110 +282,94 @@ class SubmissionOrchestrator:
                 if not ok:
                     return
 
-                assert os.path.exists(MCP_PATH), f"MCP_PATH missing: {MCP_PATH}"
+                graph_input = {**state, **result}
+                # the agents only call call_tool on it: the pool runs those on the
+                # shared MCP session, the graph itself stays on this loop
+                graph_input["mcp_session"] = mcp_pool
 
-                server_params = StdioServerParameters(
-                    command=sys.executable,
-                    args=[MCP_PATH],
-                    env={
-                        **os.environ,
-                        "DJANGO_SETTINGS_MODULE": "oer.settings",
-                        "PYTHONPATH": PROJECT_ROOT,
-                    }
-                )
+                K = 3  # number of runs
+
+                all_runs = []
 
-                # start MCP session ONCE
-                async with stdio_client(server_params) as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        print("MCP session initialized")
-
-                        graph_input = {**state, **result}
-                        graph_input["mcp_session"] = session   # shared for all agents
-
-                        K = 3  # number of runs
-
-                        all_runs = []
-
-                        for i in range(K):
-                            print(f"🔁 Evaluation Run {i+1}/{K}")
-
-                            graph_result = await compiled_graph.ainvoke(
-                                graph_input,
-                                config={
-                                    "run_name": f"Evaluation Run {i+1}",
-                                    "tags": ["multi-run", "evaluation"],
-                                    "metadata": {
-                                        "upload_id": upload_id,
-                                        "run_index": i,
-                                    }
-                                }
-                            )
-
-                            # store scores from state
-                            run_scores = {
-                                "clarity": graph_result.get("clarity_score"),
-                                "coherence": graph_result.get("coherence_score"),
-                                "engagement": graph_result.get("engagement_score"),
-                                "completeness": graph_result.get("completeness_score"),
-                                "accuracy": graph_result.get("accuracy_score"),
+                for i in range(K):
+                    logger.debug("Evaluation run %d/%d for upload %s", i + 1, K, upload_id)
+
+                    graph_result = await compiled_graph.ainvoke(
+                        graph_input,
+                        config={
+                            "run_name": f"Evaluation Run {i+1}",
+                            "tags": ["multi-run", "evaluation"],
+                            "metadata": {
+                                "upload_id": upload_id,
+                                "run_index": i,
                             }
+                        }
+                    )
 
-                            all_runs.append(run_scores)
+                    # store scores from state
+                    run_scores = {
+                        "clarity": graph_result.get("clarity_score"),
+                        "coherence": graph_result.get("coherence_score"),
+                        "engagement": graph_result.get("engagement_score"),
+                        "completeness": graph_result.get("completeness_score"),
+                        "accuracy": graph_result.get("accuracy_score"),
+                    }
 
-                            # 🔥 store per-run in DB
-                            await sync_to_async(EvaluationRun.objects.create)(
-                                upload_id=upload_id,
-                                run_number=i+1,
-                                **run_scores
-                            )
+                    all_runs.append(run_scores)
 
+                    # 🔥 store per-run in DB
+                    await sync_to_async(EvaluationRun.objects.create)(
+                        upload_id=upload_id,
+                        run_number=i+1,
+                        **run_scores
+                    )
 
-                        clarity_vals = [r["clarity"] for r in all_runs if r["clarity"] is not None]
-                        coherence_vals = [r["coherence"] for r in all_runs if r["coherence"] is not None]
-                        engagement_vals = [r["engagement"] for r in all_runs if r["engagement"] is not None]
-                        completeness_vals = [r["completeness"] for r in all_runs if r["completeness"] is not None]
-                        accuracy_vals = [r["accuracy"] for r in all_runs if r["accuracy"] is not None]
 
-                        clarity_mean, clarity_var, clarity_conf = compute_stats(clarity_vals)
-                        coherence_mean, coherence_var, coherence_conf = compute_stats(coherence_vals)
-                        engagement_mean, engagement_var, engagement_conf = compute_stats(engagement_vals)
-                        completeness_mean, completeness_var, completeness_conf = compute_stats(completeness_vals)
-                        accuracy_mean, accuracy_var, accuracy_conf = compute_stats(accuracy_vals)
+                clarity_vals = [r["clarity"] for r in all_runs if r["clarity"] is not None]
+                coherence_vals = [r["coherence"] for r in all_runs if r["coherence"] is not None]
+                engagement_vals = [r["engagement"] for r in all_runs if r["engagement"] is not None]
+                completeness_vals = [r["completeness"] for r in all_runs if r["completeness"] is not None]
+                accuracy_vals = [r["accuracy"] for r in all_runs if r["accuracy"] is not None]
 
+                clarity_mean, clarity_var, clarity_conf = compute_stats(clarity_vals)
+                coherence_mean, coherence_var, coherence_conf = compute_stats(coherence_vals)
+                engagement_mean, engagement_var, engagement_conf = compute_stats(engagement_vals)
+                completeness_mean, completeness_var, completeness_conf = compute_stats(completeness_vals)
+                accuracy_mean, accuracy_var, accuracy_conf = compute_stats(accuracy_vals)
 
-                        await sync_to_async(ContentScore.objects.update_or_create)(
-                            upload_id=upload_id,
-                            defaults={
-                                "clarity": clarity_mean,
-                                "clarity_variance": clarity_var,
-                                "clarity_confidence": clarity_conf,
 
-                                "coherence": coherence_mean,
-                                "coherence_variance": coherence_var,
-                                "coherence_confidence": coherence_conf,
+                await sync_to_async(ContentScore.objects.update_or_create)(
+                    upload_id=upload_id,
+                    defaults={
+                        "clarity": clarity_mean,
+                        "clarity_variance": clarity_var,
+                        "clarity_confidence": clarity_conf,
 
-                                "engagement": engagement_mean,
-                                "engagement_variance": engagement_var,
-                                "engagement_confidence": engagement_conf,
+                        "coherence": coherence_mean,
+                        "coherence_variance": coherence_var,
+                        "coherence_confidence": coherence_conf,
 
-                                "completeness": completeness_mean,
-                                "completeness_variance": completeness_var,
-                                "completeness_confidence": completeness_conf,
+                        "engagement": engagement_mean,
+                        "engagement_variance": engagement_var,
+                        "engagement_confidence": engagement_conf,
 
-                                "accuracy": accuracy_mean,
-                                "accuracy_variance": accuracy_var,
-                                "accuracy_confidence": accuracy_conf,
-                            }
-                        )
+                        "completeness": completeness_mean,
+                        "completeness_variance": completeness_var,
+                        "completeness_confidence": completeness_conf,
 
-                        await sync_to_async(UploadCheck.objects.filter(id=upload_id).update)(evaluation_status=True)
+                        "accuracy": accuracy_mean,
+                        "accuracy_variance": accuracy_var,
+                        "accuracy_confidence": accuracy_conf,
+                    }
+                )
 
-                        # writing scores to blockchain
-                        await finalize_evaluation(upload_id)
-                        print(f"✅ Marked upload {upload_id} as evaluated.")    
+                await sync_to_async(UploadCheck.objects.filter(id=upload_id).update)(evaluation_status=True)
 
-                print("Evaluation graph invoked!!")
+                # writing scores to blockchain
+                await finalize_evaluation(upload_id)
+                logger.info("Marked upload %s as evaluated", upload_id)
+
+                logger.info("Evaluation graph finished for upload %s", upload_id)
 
                 # 🔔 Auto-trigger Decision Maker (event-driven; no polling)
                 # Runs only if: (1) deadline is over AND (2) min contributions met.
@@ -346,21 +380,24 @@ class SubmissionOrchestrator:
                     if dm_run:
                         status = getattr(dm_run, "status", None) or (dm_run.get("status") if isinstance(dm_run, dict) else "unknown")
                         selected = getattr(dm_run, "selected_upload_id", None) or (dm_run.get("selected_upload_id") if isinstance(dm_run, dict) else None)
-                        print(f"🏁 Auto DecisionMaker: {status} (chapter_id={chapter_id}, selected_upload_id={selected})")
+                        logger.info(
+                            "Auto DecisionMaker: %s (chapter_id=%s, selected_upload_id=%s)",
+                            status, chapter_id, selected,
+                        )
 
                 except Exception as e:
-                    print(f"[WARN] Auto DecisionMaker trigger failed: {e}")
+                    logger.warning("Auto DecisionMaker trigger failed: %s", e)
 
 
             try:
                 bg_loop.run_until_complete(runner())
             except Exception as e:
-                print("Error in evaluation background thread:", repr(e))
-                traceback.print_exception(type(e), e, e.__traceback__)
+                logger.exception("Error in evaluation background thread: %r", e)
             finally:
                 bg_loop.close()
 
-        threading.Thread(target=run_graph_background, daemon=True).start()
+        # bounded: extra submissions queue up instead of each getting a thread
+        _EVALUATION_POOL.submit(run_graph_background)
 
         return result
 
@@ -382,20 +419,29 @@ def compute_stats(values):
 
 
 def increment_progress(contributor_id, chapter_id, file_type):
-    progress, _ = ChapterContributionProgress.objects.get_or_create(
-        contributor_id=contributor_id,
-        chapter_id=chapter_id
+    bulk_increment_progress(contributor_id, chapter_id, {file_type: 1})
+
+
+def bulk_increment_progress(contributor_id, chapter_id, counts):
+    """
+    Add counts ({"pdf": n, "video": n, "draft": n}) to the contributor's
+    chapter progress: one get_or_create + one atomic F() UPDATE, however
+    many files were uploaded.
+    """
+    if not any(counts.values()):
+        return
+
+    key = {"contributor_id": contributor_id, "chapter_id": chapter_id}
+    ChapterContributionProgress.objects.get_or_create(**key)
+    ChapterContributionProgress.objects.filter(**key).update(
+        pdf_count=F("pdf_count") + counts.get("pdf", 0),
+        video_count=F("video_count") + counts.get("video", 0),
+        draft_count=F("draft_count") + counts.get("draft", 0),
+        has_any_upload=True,
+        last_upload_at=timezone.now(),
     )
-
-    if file_type == "pdf":
-        progress.pdf_count += 1
-    elif file_type == "video":
-        progress.video_count += 1
-    elif file_type == "draft":
-        progress.draft_count += 1
-
-    progress.has_any_upload = True
-    progress.save()
+    # update() sends no post_save: drop the contributor's dashboard cache here
+    dashboard_cache.invalidate_user(contributor_id)
 
 @csrf_exempt
 def confirm_submission(request):
@@ -406,7 +452,13 @@ def confirm_submission(request):
     if not all([contributor_id, course_id, chapter_id]):
         return JsonResponse({"error": "Missing session data"}, status=400)
 
-    chapter = Chapter.objects.get(id=chapter_id)
+    # course name joined in for the success email
+    chapter = (
+        Chapter.objects
+        .select_related("course")
+        .only("chapter_number", "chapter_name", "course__course_name")
+        .get(id=chapter_id)
+    )
     chapter_number = chapter.chapter_number
 
     # -------------------------------------------------------
@@ -439,21 +491,17 @@ def confirm_submission(request):
     service = GoogleDriveAuthService.get_service()
     folder_service = GoogleDriveFolderService(service)
 
-    oer_root_id = folder_service.get_or_create_folder("oer_content")
 
     # Root folders
-    pdf_root_id = folder_service.get_or_create_folder(
-        settings.GOOGLE_DRIVE_FOLDERS["pdf"], oer_root_id
-    )
-    video_root_id = folder_service.get_or_create_folder(
-        settings.GOOGLE_DRIVE_FOLDERS["videos"], oer_root_id
-    )
+    pdf_root_id = folder_service.get_category_root_id("pdf")
+    video_root_id = folder_service.get_category_root_id("videos")
 
     base_folder = f"{contributor_id}_{course_id}_{chapter_number}"
 
     # Contributor folders
-    pdf_folder_id = folder_service.get_or_create_folder(base_folder, pdf_root_id)
-    video_folder_id = folder_service.get_or_create_folder(base_folder, video_root_id)
+    pdf_folder_id, video_folder_id = folder_service.get_or_create_folders(
+        [(base_folder, pdf_root_id), (base_folder, video_root_id)]
+    )
 
     # -------------------------------
     # REQUIRED LangGraph State
@@ -469,7 +517,7 @@ def confirm_submission(request):
         },
     }
 
-    print("Reached till submission orchestrator")
+    logger.debug("Reached submission orchestrator")
 
     # -------------------------------
     # Run Submission + Evaluation
@@ -477,7 +525,7 @@ def confirm_submission(request):
     result = SubmissionOrchestrator.submit_and_evaluate(state)
 
     if result.get("status") == "success":
-        contributor = User.objects.get(id=contributor_id)
+        contributor = User.objects.only("email", "first_name").get(id=contributor_id)
 
         try:
             ContributionSuccessEmail(
@@ -487,7 +535,7 @@ def confirm_submission(request):
                 chapter.chapter_name
             ).send()
         except Exception as e:
-            print(f"⚠️ Could not send email (Check .env password): {e}")
+            logger.warning("Could not send email (check .env password): %s", e)
 
 
         return render(request, "contributor/final_submission.html")
@@ -500,7 +548,7 @@ def contributor_upload_file(request):
     chapter_id = request.GET.get("chapter_id")
     topic = unquote(request.GET.get('topic', ''))
 
-    print("Upload file topic name: ", topic)
+    logger.debug("Upload file topic name: %s", topic)
 
     tab = request.GET.get("tab", "content")
 
@@ -531,28 +579,29 @@ def contributor_upload_file(request):
         service = GoogleDriveAuthService.get_service()
         folder_service = GoogleDriveFolderService(service)
 
-        oer_root_id = folder_service.get_or_create_folder("oer_content")
+        folder_types = ["drafts", "pdf", "videos", "assessments"]
+        topic_folder_query = f"{FOLDER_QUERY} and name='{drive_q_escape(topic)}'"
+        # resolved here so the listing threads only make Drive calls
+        root_ids = {t: folder_service.get_category_root_id(t) for t in folder_types}
 
         # --- SAME LOGIC AS YOUR WORKING VERSION ---
         def get_files_from_folder(folder_type):
+            # httplib2 is not thread-safe: each pool thread uses its own client
+            service = GoogleDriveAuthService.get_service()
             folder_name = f"{contributor_id}_{course.id}_{chapter.chapter_number}"
 
-            root_folder_id = folder_service.get_or_create_folder(
-                settings.GOOGLE_DRIVE_FOLDERS[folder_type],
-                oer_root_id
-            )
+            root_folder_id = root_ids[folder_type]
 
             # Contributor chapter folder
             query = (
-                "mimeType='application/vnd.google-apps.folder' "
-                f"and name='{folder_name}' "
-                f"and '{root_folder_id}' in parents "
-                "and trashed=false"
+                f"{FOLDER_QUERY} and name='{drive_q_escape(folder_name)}' "
+                f"and '{drive_q_escape(root_folder_id)}' in parents"
             )
 
+            # only the first match is used
             folders = (
                 service.files()
-                .list(q=query, fields="files(id, name)")
+                .list(q=query, fields="files(id)", pageSize=1)
                 .execute()
                 .get("files", [])
             )
@@ -563,19 +612,15 @@ def contributor_upload_file(request):
             chapter_folder_id = folders[0]["id"]
             collected_files = []
 
-            # Fetch topic folders
-            topic_folders = (
-                service.files()
-                .list(
-                    q=(
-                        "mimeType='application/vnd.google-apps.folder' "
-                        f"and '{chapter_folder_id}' in parents "
-                        "and trashed=false"
-                    ),
-                    fields="files(id, name)"
-                )
-                .execute()
-                .get("files", [])
+            # Fetch the topic's folder(s): the name filter runs in Drive, and the
+            # topic is escaped so a quote in it can't break the query
+            topic_folders = list_files(
+                service,
+                (
+                    f"{topic_folder_query} "
+                    f"and '{drive_q_escape(chapter_folder_id)}' in parents"
+                ),
+                "id, name",
             )
 
             for topic_folder in topic_folders:
@@ -585,21 +630,14 @@ def contributor_upload_file(request):
                 if topic_name != topic:
                     continue
 
-                # print(f"📂 MATCHED TOPIC FOLDER: {topic_name}")
-
                 topic_id = topic_folder["id"]
 
-                files_result = (
-                    service.files()
-                    .list(
-                        q=f"'{topic_id}' in parents and trashed=false",
-                        fields="files(id, name, mimeType)"
-                    )
-                    .execute()
-                )
-
-                for f in files_result.get("files", []):
-                    print(f"📄 FILE FOUND: {f['name']} (inside {topic_name})")
+                for f in list_files(
+                    service,
+                    f"'{drive_q_escape(topic_id)}' in parents and trashed=false",
+                    "id, name, mimeType",
+                ):
+                    logger.debug("File found: %s (inside %s)", f["name"], topic_name)
 
                     collected_files.append({
                         "id": f["id"],
@@ -612,11 +650,13 @@ def contributor_upload_file(request):
             return collected_files
 
         # Aggregate files
-        for folder_type in ["drafts", "pdf", "videos", "assessments"]:
-            files.extend(get_files_from_folder(folder_type))
+        # the four category trees are independent: list them concurrently
+        for folder_files in _DRIVE_POOL.map(get_files_from_folder, folder_types):
+            files.extend(folder_files)
 
     except RefreshError as e:
-        print("[ERROR] Google token invalid:", e)
+        logger.error("Google token invalid: %s", e)
+        GoogleDriveAuthService.reset()
 
         token_path = settings.GOOGLE_TOKEN_FILE
         if os.path.exists(token_path):
@@ -629,13 +669,13 @@ def contributor_upload_file(request):
         return redirect("contributor_dashboard")
 
     except Exception as e:
-        print("[ERROR] Unexpected Drive issue:", e)
+        logger.exception("Unexpected Drive issue: %s", e)
         messages.error(request, f"An unexpected error occurred: {e}")
         files = []
 
     # ---- Topic extraction ----
     raw_desc = chapter.description or ""
-    topics = [t.strip() for t in re.split(r"[;,.]", raw_desc) if t.strip()]
+    topics = [topic for part in _TOPIC_SPLIT_RE.split(raw_desc) if (topic := part.strip())]
 
     pdf_files = [f for f in files if f.get("type") == "pdf"]
 
@@ -646,7 +686,7 @@ def contributor_upload_file(request):
         contributor_id=request.user,
         course=course,
         chapter=chapter
-    ).order_by("-id")
+    ).only("id", "created_at").order_by("-id")
 
     context = {
         "course": course,
@@ -680,6 +720,9 @@ def upload_files(request):
 
     MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB
 
+    counts = {"pdf": 0, "video": 0, "draft": 0}
+    uploads = []
+
     for uploaded_file in files:
         if uploaded_file.size > MAX_FILE_SIZE:
             messages.error(
@@ -688,10 +731,6 @@ def upload_files(request):
             )
             continue
 
-        # READ FILE CONTENT SAFELY
-        file_bytes = uploaded_file.read()
-        uploaded_file.seek(0)  # reset pointer (important)
-
         content_type = uploaded_file.content_type
 
         if content_type == "application/pdf":
@@ -710,17 +749,31 @@ def upload_files(request):
         else:
             continue
 
-        # PASS BYTES, NOT FILE HANDLE
-        drive.upload_file_bytes(
-            file_bytes=file_bytes,
+        # stream the upload's own file object to Drive (started right away,
+        # folders for the next files are resolved meanwhile)
+        uploaded_file.seek(0)
+        uploads.append((file_type, _DRIVE_POOL.submit(
+            drive.upload_file_stream,
+            fileobj=uploaded_file.file,
             filename=uploaded_file.name,
             folder_id=folder,
             content_type=content_type,
-            contributor_id=contributor_id
-        )
+            size=uploaded_file.size,
+        )))
+
+    error = None
+    for file_type, upload in uploads:
+        try:
+            upload.result()
+        except Exception as e:
+            error = error or e
+        else:
+            counts[file_type] += 1
 
-        # DB Progress update
-        increment_progress(contributor_id, chapter_id, file_type)
+    # DB Progress update (once for the whole batch, successful uploads only)
+    bulk_increment_progress(contributor_id, chapter_id, counts)
+    if error is not None:
+        raise error
 
     messages.success(request, "Files uploaded successfully")
 
@@ -748,51 +801,11 @@ def contributor_editor(request):
     chapter_name = request.session.get("chapter_name", "structured_query_language")
     topic_name = request.POST.get("topic") or request.GET.get("topic")
 
-    print("Editor topic name: ", topic_name)
+    logger.debug("Editor topic name: %s", topic_name)
 
     if topic_name:
         topic_name = topic_name.replace("/", "_").strip()
 
-    # --- Root folders ---
-    oer_root_id = folder_service.get_or_create_folder("oer_content")
-
-    drafts_root_id = folder_service.get_or_create_folder(
-        settings.GOOGLE_DRIVE_FOLDERS["drafts"],
-        oer_root_id
-    )
-
-    pdf_root_id = folder_service.get_or_create_folder(
-        settings.GOOGLE_DRIVE_FOLDERS["pdf"],
-        oer_root_id
-    )
-
-    # --- Contributor-level folders ---
-    base_folder_name = f"{contributor_id}_{course_id}_{chapter_number}"
-
-    drafts_folder_id = folder_service.get_or_create_folder(
-        base_folder_name,
-        drafts_root_id
-    )
-
-    pdf_folder_id = folder_service.get_or_create_folder(
-        base_folder_name,
-        pdf_root_id
-    )
-
-    # --- Topic-level folders ---
-    if topic_name:
-        drafts_topic_folder_id = folder_service.get_or_create_folder(
-            topic_name,
-            drafts_folder_id
-        )
-        pdf_topic_folder_id = folder_service.get_or_create_folder(
-            topic_name,
-            pdf_folder_id
-        )
-    else:
-        drafts_topic_folder_id = drafts_folder_id
-        pdf_topic_folder_id = pdf_folder_id
-
     # ======================================================
     # POST: Save Draft or Submit Draft
     # ======================================================
@@ -802,13 +815,35 @@ def contributor_editor(request):
         filename = request.POST.get("filename", "draft")
         file_id = request.POST.get("file_id")
 
+        # Folders are only needed to store something: GETs go straight to the redirect
+        # --- Root folders ---
+        drafts_root_id = folder_service.get_category_root_id("drafts")
+
+        pdf_root_id = folder_service.get_category_root_id("pdf")
+
+        # --- Contributor-level folders ---
+        base_folder_name = f"{contributor_id}_{course_id}_{chapter_number}"
+
+        drafts_folder_id, pdf_folder_id = folder_service.get_or_create_folders(
+            [(base_folder_name, drafts_root_id), (base_folder_name, pdf_root_id)]
+        )
+
+        # --- Topic-level folders ---
+        if topic_name:
+            drafts_topic_folder_id, pdf_topic_folder_id = folder_service.get_or_create_folders(
+                [(topic_name, drafts_folder_id), (topic_name, pdf_folder_id)]
+            )
+        else:
+            drafts_topic_folder_id = drafts_folder_id
+            pdf_topic_folder_id = pdf_folder_id
+
         try:
             # ---------- SAVE DRAFT ----------
             if action == "draft":
                 from bs4 import BeautifulSoup
 
                 doc = Document()
-                soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, "lxml")
 
                 for block in soup.find_all(["p", "div"]):
                     text = block.get_text(strip=True)
@@ -820,10 +855,10 @@ def contributor_editor(request):
                 increment_progress(contributor_id, request.session.get("chapter_id"), "draft")
                 file_io.seek(0)
 
-                media = MediaIoBaseUpload(
+                media = media_upload(
                     file_io,
-                    mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    resumable=True
+                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    file_io.getbuffer().nbytes,
                 )
 
                 doc_filename = filename if filename.lower().endswith(".docx") else f"{filename}.docx"
@@ -835,28 +870,27 @@ def contributor_editor(request):
                         media_body=media
                     ).execute()
                 else:
-                    service.files().create(
-                        body={
+                    create_file(
+                        service,
+                        {
                             "name": drive_filename,
                             "parents": [drafts_topic_folder_id]
                         },
-                        media_body=media,
-                        fields="id"
-                    ).execute()
+                        media,
+                    )
 
             # ---------- SUBMIT AS PDF ----------
             elif action == "submitDraft":
-                pdf_io = io.BytesIO()
-                result = pisa.CreatePDF(io.StringIO(content), dest=pdf_io)
+                pdf_bytes = render_pdf_in_pool(content)
 
-                if result.err:
+                if pdf_bytes is None:
                     raise Exception("PDF generation failed")
 
-                pdf_io.seek(0)
+                pdf_io = io.BytesIO(pdf_bytes)
 
                 MAX_EDITOR_SIZE = 40 * 1024 * 1024  # 40MB
 
-                pdf_size = len(pdf_io.getvalue())
+                pdf_size = len(pdf_bytes)  # the rendered bytes; no buffer copy
 
                 if pdf_size > MAX_EDITOR_SIZE:
                     messages.error(
@@ -865,24 +899,20 @@ def contributor_editor(request):
                     )
                     return redirect(request.path)
 
-                media = MediaIoBaseUpload(
-                    pdf_io,
-                    mimetype="application/pdf",
-                    resumable=True
-                )
+                media = media_upload(pdf_io, "application/pdf", pdf_size)
 
                 pdf_filename = filename if filename.lower().endswith(".pdf") else f"{filename}.pdf"
                 if not pdf_filename.startswith(f"{contributor_id}_"):
                     pdf_filename = f"{pdf_filename}"
 
-                service.files().create(
-                    body={
+                create_file(
+                    service,
+                    {
                         "name": pdf_filename,
                         "parents": [pdf_topic_folder_id]
                     },
-                    media_body=media,
-                    fields="id"
-                ).execute()
+                    media,
+                )
 
                 increment_progress(contributor_id, request.session.get("chapter_id"), "pdf")
 
@@ -891,25 +921,12 @@ def contributor_editor(request):
                     try:
                         service.files().delete(fileId=file_id).execute()
                     except Exception as e:
-                        print(f"[WARN] Could not delete draft {file_id}: {e}")
+                        logger.warning("Could not delete draft %s: %s", file_id, e)
 
         except Exception as e:
-            print(f"[ERROR] Draft action failed: {e}")
+            logger.exception("Draft action failed: %s", e)
             messages.error(request, f"Failed to save draft: {e}")
 
-    # ======================================================
-    # Fetch existing drafts (for UI)
-    # ======================================================
-    try:
-        results = service.files().list(
-            q=f"'{drafts_folder_id}' in parents and trashed=false",
-            fields="files(id, name, createdTime)"
-        ).execute()
-        files = results.get("files", [])
-    except Exception as e:
-        print(f"[ERROR] Failed to fetch drafts: {e}")
-        files = []
-
     # --- Restore GET params and redirect ---
     request.GET = request.GET.copy()
     request.GET["course_id"] = str(course_id)
@@ -926,13 +943,42 @@ def contributor_editor(request):
 
 
 # ---------------- LOAD FILE CONTENT ---------------- #
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def docx_paragraph_texts(fh):
+    """
+    Text of the body paragraphs of a .docx (what python-docx's
+    doc.paragraphs gives), read straight from word/document.xml instead of
+    loading the whole package.
+    """
+    from lxml import etree
+
+    with zipfile.ZipFile(fh) as z:
+        root = etree.fromstring(z.read("word/document.xml"))
+
+    body = root.find(f"{_W_NS}body")
+    if body is None:
+        return []
+
+    texts = []
+    for p in body.iterchildren(f"{_W_NS}p"):
+        parts = []
+        for node in p.iter(f"{_W_NS}t", f"{_W_NS}tab", f"{_W_NS}br", f"{_W_NS}cr"):
+            if node.tag == f"{_W_NS}t":
+                parts.append(node.text or "")
+            else:
+                parts.append("\t" if node.tag == f"{_W_NS}tab" else "\n")
+        texts.append("".join(parts))
+    return texts
+
+
 @csrf_exempt
 def load_file(request):
-    print("Load file")
     service = GoogleDriveAuthService.get_service()
     file_id = request.GET.get('file_id')
 
-    print(file_id)
+    logger.debug("Load file: %s", file_id)
 
     if not file_id:
         return JsonResponse({'error': 'file_id is required'}, status=400)
@@ -948,17 +994,13 @@ def load_file(request):
             _, done = downloader.next_chunk()
         fh.seek(0)
 
-        print("Loading file_id:", file_id)
-        print("Service object:", service)
 
         if 'text/html' in mime_type:
             content = fh.getvalue().decode('utf-8')
         elif mime_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-            import docx
-            doc = docx.Document(fh)
-            paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-            # Join with <p> tags for TinyMCE
-            content = ''.join(f'<p>{p}</p>' for p in paragraphs)
+            paragraphs = [p for p in docx_paragraph_texts(fh) if p.strip()]
+            # Join with <p> tags for TinyMCE (one C-level join, no per-paragraph format)
+            content = f"<p>{'</p><p>'.join(paragraphs)}</p>" if paragraphs else ""
         else:
             content = f"<p>Cannot edit file of type {mime_type} in the editor.</p>"
 
@@ -1024,10 +1066,8 @@ def delete_drive_file(request):
 
 
 @csrf_exempt
+@require_POST
 def gemini_chat(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
-
     try:
         # multipart/form-data
         user_message = request.POST.get("message", "").strip()
@@ -1053,9 +1093,37 @@ def gemini_chat(request):
                 "data": file_bytes
             })
 
+        # text-only messages may be answered from this user's earlier replies;
+        # media requests and no_cache=1 always go to Gemini
+        user_id = request.session.get("contributor_id") or request.user.id
+        use_cache = (
+            user_id is not None
+            and not files
+            and request.POST.get("no_cache") != "1"
+        )
+
+        # the cache is best effort: any failure in it falls through to Gemini
+        embedding = None
+        if use_cache:
+            try:
+                embedding = chat_cache.embed_message(user_message)
+                if embedding is not None:
+                    reply = chat_cache.lookup_reply(user_id, embedding)
+                    if reply is not None:
+                        return JsonResponse({"reply": reply})
+            except Exception:
+                logger.exception("Chat cache lookup failed")
+                embedding = None
+
         # send to Gemini via LangChain
         response = llm.invoke([HumanMessage(content=content)])
 
+        if embedding is not None:
+            try:
+                chat_cache.store_reply(user_id, embedding, response.content)
+            except Exception:
+                logger.exception("Chat cache store failed")
+
         return JsonResponse({"reply": response.content})
 
     except Exception as e:
@@ -1063,11 +1131,15 @@ def gemini_chat(request):
 
 
 @csrf_exempt
+@require_POST
 def generate_assessment(request):
-    """Generate MCQ assessment from selected PDFs using Gemini."""
+    """
+    Generate MCQ assessment from selected PDFs using Gemini.
 
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
+    Validates the request and queues build_assessment(); the response is a
+    202 with the job's status_url, which answers with build_assessment()'s
+    result once it is done.
+    """
 
     try:
         # =====================================================
@@ -1102,35 +1174,128 @@ def generate_assessment(request):
                 status=400
             )
 
+        # one query, and the chapter must belong to the course
+        if not Chapter.objects.filter(id=chapter_id, course_id=course_id).exists():
+            return JsonResponse(
+                {"error": "Chapter not found for this course"},
+                status=400
+            )
+
+        # the job row is shared by every worker process, so any of them can
+        # answer the status poll; the contributor's old jobs are dropped on the way
+        AssessmentJob.objects.filter(
+            contributor_id=contributor_id,
+            created_at__lt=timezone.now() - ASSESSMENT_JOB_RETENTION,
+        ).delete()
+        job = AssessmentJob.objects.create(contributor_id=contributor_id)
+
+        _ASSESSMENT_POOL.submit(
+            run_assessment_job, job.id, contributor_id, course_id, chapter_id,
+            topic_name, difficulty, question_count, custom_prompt, selected_file_ids,
+        )
+
+        return JsonResponse({
+            "job_id": str(job.id),
+            "status_url": reverse("generate_assessment_status", args=[job.id]),
+        }, status=202)
+
+    except Exception as e:
+        logger.exception("Assessment generation failed: %s", e)
+        return JsonResponse(
+            {"error": str(e)},
+            status=500
+        )
+
+
+def run_assessment_job(job_id, contributor_id, *args):
+    """Run build_assessment() on a pool thread and store its response on the job row."""
+    # pool threads outlive requests: drop connections past CONN_MAX_AGE or
+    # broken, before and after the job
+    close_old_connections()
+    try:
+        try:
+            response = build_assessment(contributor_id, *args)
+        except Exception as e:
+            logger.exception("Assessment job %s failed: %s", job_id, e)
+            response = JsonResponse({"error": str(e)}, status=500)
+
+        AssessmentJob.objects.filter(id=job_id).update(
+            status_code=response.status_code,
+            response=response.content.decode("utf-8"),
+        )
+    finally:
+        close_old_connections()
+
+
+def generate_assessment_status(request, job_id):
+    """Poll target for generate_assessment: 202 while running, then the job's response."""
+    job = (
+        AssessmentJob.objects
+        .filter(id=job_id, contributor_id=request.session.get("contributor_id"))
+        .only("status_code", "response", "created_at")
+        .first()
+    )
+
+    if job is None:
+        return JsonResponse({"error": "Unknown assessment job"}, status=404)
+
+    if job.status_code is None:
+        # a job whose process went away (restart, crash) never finishes
+        if timezone.now() - job.created_at > ASSESSMENT_JOB_TIMEOUT:
+            return JsonResponse(
+                {"error": "Assessment generation timed out. Please try again."},
+                status=504
+            )
+        return JsonResponse({"status": "pending"}, status=202)
+
+    return HttpResponse(
+        job.response,
+        status=job.status_code,
+        content_type="application/json"
+    )
+
+
+def build_assessment(contributor_id, course_id, chapter_id, topic_name,
+                     difficulty, question_count, custom_prompt, selected_file_ids):
+    """
+    Sections 2-9 of generate_assessment, run on _ASSESSMENT_POOL: download
+    and read the PDFs, ask Gemini, save the assessment. Returns the
+    JsonResponse the view used to send.
+    """
+
+    try:
+        # this job thread's Drive client, used for the file-name lookups;
+        # the downloads use the Drive pool threads' own clients
+        service = GoogleDriveAuthService.get_service()
+
         # =====================================================
         # 2. PREVENT PDF REUSE
         # =====================================================
-        already_used = AssessmentSource.objects.filter(
+        # downloads start first, so they overlap the reuse check and the
+        # existing-questions query; results are read in selection order
+        downloads = [
+            _DRIVE_POOL.submit(download_drive_file, file_id)
+            for file_id in selected_file_ids
+        ]
+
+        used_ids = list(AssessmentSource.objects.filter(
             assessment__contributor_id=contributor_id,
             drive_file_id__in=selected_file_ids
-        ).values_list("drive_file_id", flat=True)
-
-        if already_used:
-            service = GoogleDriveAuthService.get_service()
-
-            used_ids = AssessmentSource.objects.filter(
-                assessment__contributor_id=contributor_id,
-                drive_file_id__in=selected_file_ids
-            ).values_list("drive_file_id", flat=True)
+        ).values_list("drive_file_id", flat=True))
 
-            used_files = []
+        if used_ids:
+            for download in downloads:
+                download.cancel()
 
-            for fid in used_ids:
-                try:
-                    meta = service.files().get(
-                        fileId=fid,
-                        fields="name"
-                    ).execute()
-
-                    used_files.append(meta.get("name", "Unknown File"))
+            try:
+                used_names = get_file_names(service, used_ids)
+            except Exception:
+                used_names = {}
 
-                except Exception:
-                    used_files.append("Unknown File")
+            used_files = [
+                used_names.get(fid, "Unknown File")
+                for fid in used_ids
+            ]
 
             return JsonResponse({
                 "error": "Some selected PDFs were already used: "
@@ -1138,37 +1303,38 @@ def generate_assessment(request):
             }, status=400)
 
         # =====================================================
-        # 3. GOOGLE DRIVE DOWNLOAD
+        # 3. FETCH EXISTING QUESTIONS (UNIQUENESS)
         # =====================================================
-        service = GoogleDriveAuthService.get_service()
-        pdf_texts = []
-
-        for file_id in selected_file_ids:
-            file_io = io.BytesIO()
+        # the newest 200, so recent questions are the ones the model avoids;
+        # listed oldest first to keep the prompt prefix stable
+        existing_questions = list(Question.objects.filter(
+            assessment__contributor_id=contributor_id
+        ).order_by("-id").values_list("text", flat=True)[:200])
 
-            downloader = MediaIoBaseDownload(
-                file_io,
-                service.files().get_media(fileId=file_id)
-            )
+        existing_questions_text = "\n".join(reversed(existing_questions))
 
-            done = False
-            while not done:
-                _, done = downloader.next_chunk()
+        # =====================================================
+        # 4. READ THE DOWNLOADED PDFS
+        # =====================================================
+        pdf_texts = []
+        remaining = SOURCE_TEXT_LIMIT
 
-            file_io.seek(0)
+        for file_id, download in zip(selected_file_ids, downloads):
+            # the prompt only keeps SOURCE_TEXT_LIMIT characters: once they
+            # are in, skip the remaining PDFs (and their pages)
+            if remaining <= 0:
+                download.cancel()
+                continue
 
             try:
-                reader = PdfReader(file_io)
-                text = "\n".join(
-                    page.extract_text() or ""
-                    for page in reader.pages
-                )
+                text = extract_pdf_text_in_pool(download.result().getvalue(), remaining)
 
                 if text.strip():
                     pdf_texts.append(text)
+                    remaining -= len(text) + 1
 
             except Exception as e:
-                print(f"[WARN] Skipping PDF {file_id}: {e}")
+                logger.warning("Skipping PDF %s: %s", file_id, e)
 
         if not pdf_texts:
             return JsonResponse(
@@ -1176,24 +1342,27 @@ def generate_assessment(request):
                 status=400
             )
 
-        combined_text = "\n".join(pdf_texts)[:15000]
-
-        # =====================================================
-        # 4. FETCH EXISTING QUESTIONS (UNIQUENESS)
-        # =====================================================
-        existing_questions = Question.objects.filter(
-            assessment__contributor_id=contributor_id
-        ).values_list("text", flat=True)[:200]
-
-        existing_questions_text = "\n".join(existing_questions)
+        combined_text = "\n".join(pdf_texts)[:SOURCE_TEXT_LIMIT]
 
         # =====================================================
         # 5. GEMINI PROMPT
         # =====================================================
+        # The large, stable parts (source text, earlier questions) lead the
+        # prompt and the per-request settings follow, so re-generations share
+        # a prefix that Gemini's implicit context cache can reuse.
         prompt = f"""
 You are an expert educational assessment generator.
 
-Generate {question_count} UNIQUE multiple-choice questions.
+Content Source:
+{combined_text}
+
+Previously generated questions
+(Do NOT repeat or rephrase):
+
+{existing_questions_text}
+
+Generate {question_count} UNIQUE multiple-choice questions
+from the content source above.
 
 STRICT RULES:
 - Difficulty Level: {difficulty}
@@ -1207,14 +1376,6 @@ STRICT RULES:
 Additional Instructions:
 {custom_prompt}
 
-Previously generated questions
-(Do NOT repeat or rephrase):
-
-{existing_questions_text}
-
-Content Source:
-{combined_text}
-
 Return JSON:
 {{
   "questions":[
@@ -1230,15 +1391,10 @@ Return JSON:
         response = llm.invoke(prompt)
         response_text = response.content.strip()
 
-        cleaned_text = re.sub(
-            r"^```(?:json)?\s*|\s*```$",
-            "",
-            response_text,
-            flags=re.DOTALL
-        ).strip()
+        cleaned_text = _JSON_FENCE_RE.sub("", response_text).strip()
 
         try:
-            result = json.loads(cleaned_text)
+            result = _json_loads(cleaned_text)
         except json.JSONDecodeError:
             return JsonResponse({
                 "error": "Gemini returned invalid JSON",
@@ -1246,95 +1402,91 @@ Return JSON:
             }, status=500)
 
         # =====================================================
-        # 6. CREATE ASSESSMENT
+        # 6. HARD DUPLICATE PROTECTION
         # =====================================================
-        contributor = User.objects.get(id=contributor_id)
-        course = Course.objects.get(id=course_id)
-        chapter = Chapter.objects.get(id=chapter_id)
+        generated = [
+            (q_data.get("text", "").strip(), q_data)
+            for q_data in result.get("questions", [])
+        ]
 
-        assessment = Assessment.objects.create(
-            course=course,
-            chapter=chapter,
-            contributor_id=contributor,
-            topic=topic_name
-        )
-
-        # =====================================================
-        # 7. SAVE USED PDF SOURCES (WITH REAL FILENAMES)
-        # =====================================================
-
-        file_metadata_map = {}
-
-        # Fetch filenames from Google Drive
-        for file_id in selected_file_ids:
-            try:
-                meta = service.files().get(
-                    fileId=file_id,
-                    fields="id,name"
-                ).execute()
-
-                file_metadata_map[file_id] = meta.get(
-                    "name",
-                    "Unknown File"
-                )
-
-            except Exception as e:
-                print(f"[WARN] Could not fetch name for {file_id}: {e}")
-                file_metadata_map[file_id] = "Unknown File"
-
-
-        # Save sources
-        for file_id in selected_file_ids:
-            AssessmentSource.objects.create(
-                assessment=assessment,
-                drive_file_id=file_id,
-                file_name=file_metadata_map.get(
-                    file_id,
-                    "Unknown File"
-                )
-            )
-        # =====================================================
-        # 8. HARD DUPLICATE PROTECTION
-        # =====================================================
+        # only the generated texts are looked up, not every earlier question
         existing_set = set(
             Question.objects.filter(
-                assessment__contributor_id=contributor_id
+                assessment__contributor_id=contributor_id,
+                text__in=[q_text for q_text, _ in generated if q_text]
             ).values_list("text", flat=True)
         )
 
-        saved_count = 0
-
-        for q_data in result.get("questions", []):
+        new_questions = []
 
-            q_text = q_data.get("text", "").strip()
+        for q_text, q_data in generated:
 
             if not q_text or q_text in existing_set:
                 continue
 
-            question = Question.objects.create(
-                assessment=assessment,
-                text=q_text,
-                correct_option=q_data.get(
-                    "correct_option", 0
-                )
-            )
-
             existing_set.add(q_text)
-            saved_count += 1
-
-            for opt in q_data.get("options", []):
-                Option.objects.create(
-                    question=question,
-                    text=opt
-                )
+            new_questions.append((q_text, q_data))
 
-        if saved_count == 0:
-            assessment.delete()
+        if not new_questions:
             return JsonResponse({
                 "error":
                     "All generated questions were duplicates."
             }, status=400)
 
+        # =====================================================
+        # 7. FETCH SOURCE FILENAMES
+        # =====================================================
+        # Drive call stays outside the transaction below (one batch request)
+        try:
+            file_metadata_map = get_file_names(service, selected_file_ids)
+        except Exception as e:
+            logger.warning("Could not fetch file names: %s", e)
+            file_metadata_map = {}
+
+        # =====================================================
+        # 8. SAVE ASSESSMENT, SOURCES, QUESTIONS AND OPTIONS
+        # =====================================================
+        # one transaction: a single commit for all rows, and no half-saved
+        # assessment if an insert fails
+        with transaction.atomic():
+            # ids were validated in section 1; the FK columns need no model loads
+            assessment = Assessment.objects.create(
+                course_id=course_id,
+                chapter_id=chapter_id,
+                contributor_id_id=contributor_id,
+                topic=topic_name
+            )
+
+            AssessmentSource.objects.bulk_create([
+                AssessmentSource(
+                    assessment=assessment,
+                    drive_file_id=file_id,
+                    file_name=file_metadata_map.get(
+                        file_id,
+                        "Unknown File"
+                    )
+                )
+                for file_id in selected_file_ids
+            ])
+
+            # Postgres returns the new PKs, so options can point at them directly
+            questions = Question.objects.bulk_create([
+                Question(
+                    assessment=assessment,
+                    text=q_text,
+                    correct_option=q_data.get(
+                        "correct_option", 0
+                    )
+                )
+                for q_text, q_data in new_questions
+            ])
+
+            Option.objects.bulk_create([
+                Option(question=question, text=opt)
+                for question, (_, q_data) in zip(questions, new_questions)
+                for opt in q_data.get("options", [])
+            ], batch_size=500)
+
         # =====================================================
         # 9. REDIRECT
         # =====================================================
@@ -1349,7 +1501,7 @@ Return JSON:
         })
 
     except Exception as e:
-        print("[ERROR] Assessment generation failed:", e)
+        logger.exception("Assessment generation failed: %s", e)
         return JsonResponse(
             {"error": str(e)},
             status=500
@@ -1368,7 +1520,7 @@ def generated_assessment_form(request, assessment_id):
 
 
 def after_submission(request):
-    print("After submission view called")
+    logger.debug("After submission view called")
     # generate_expertise()
     # Clear all session data safely
     return render(request, 'contributor/after_submission.html')
@@ -1398,10 +1550,8 @@ def list_resources(request):
 
 
 @csrf_exempt
+@require_POST
 def add_resource(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
-
     title = request.POST.get("title")
     url = request.POST.get("url")
     resource_type = request.POST.get("type", "youtube")
@@ -1427,10 +1577,8 @@ def add_resource(request):
 
 
 @csrf_exempt
+@require_POST
 def delete_resource(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Invalid method"}, status=405)
-
     rid = request.POST.get("id")
     ExternalResource.objects.filter(id=rid, created_by=request.user).delete()
 
@@ -1445,19 +1593,15 @@ def run_auto_submit(contributor_id, chapter_id):
     service = GoogleDriveAuthService.get_service()
     folder_service = GoogleDriveFolderService(service)
 
-    oer_root_id = folder_service.get_or_create_folder("oer_content")
 
-    pdf_root_id = folder_service.get_or_create_folder(
-        settings.GOOGLE_DRIVE_FOLDERS["pdf"], oer_root_id
-    )
-    video_root_id = folder_service.get_or_create_folder(
-        settings.GOOGLE_DRIVE_FOLDERS["videos"], oer_root_id
-    )
+    pdf_root_id = folder_service.get_category_root_id("pdf")
+    video_root_id = folder_service.get_category_root_id("videos")
 
     base_folder = f"{contributor_id}_{course_id}_{chapter_number}"
 
-    pdf_folder_id = folder_service.get_or_create_folder(base_folder, pdf_root_id)
-    video_folder_id = folder_service.get_or_create_folder(base_folder, video_root_id)
+    pdf_folder_id, video_folder_id = folder_service.get_or_create_folders(
+        [(base_folder, pdf_root_id), (base_folder, video_root_id)]
+    )
 
     state = {
         "contributor_id": contributor_id,
@@ -1538,7 +1682,7 @@ from langgraph_agents.review_graph.review_workflow import (
 
 async def check_topic_quality(request):
 
-    data = json.loads(request.body)
+    data = _json_loads(request.body)
 
     topic = data.get("topic")
     notes = data.get("notes")
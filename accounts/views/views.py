@@ -7,8 +7,7 @@ from django.contrib.auth.decorators import login_required
 
 from .contributor.expertise_service import save_user_expertise
 from .contributor.generate_expertise import generate_expertise
-from .contributor.recommendation_service import recommend_courses_for_contributor, \
-    save_expertise_and_generate_course_links
+from .contributor.recommendation_service import save_expertise_and_generate_course_links
 from .email.email_service import RegistrationSuccessEmail
 from ..models import User, Course
 from ..forms import ProfilePictureForm # Add this new import at the top
@@ -146,9 +145,6 @@ def register_view(request):
             raw_expertise = request.POST.get("domain", "")
             save_expertise_and_generate_course_links(user, raw_expertise)
 
-            recommended = recommend_courses_for_contributor(user)
-            print("Recommended:", list(recommended.values_list("course_name", flat=True)))
-
             RegistrationSuccessEmail(user.email, user.first_name).send()
             messages.info(request, "Registration successful. Your contributor account is pending approval.")
             return redirect("pending_approval")
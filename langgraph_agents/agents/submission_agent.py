@@ -251,6 +251,10 @@ async def run_extraction_background(contributor_id: int, chapter_id: int, upload
                 )
             )()
 
+            # wake the evaluation thread waiting on this upload
+            from langgraph_agents.services.extraction_events import mark_extraction_done
+            mark_extraction_done(upload_id)
+
 
             print("\nBACKGROUND EXTRACTION DONE")
             print("Upload ID:", upload_id)
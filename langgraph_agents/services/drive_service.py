@@ -1,13 +1,133 @@
+import hashlib
 import json
 import os
-from typing import Optional
+import threading
+from typing import Iterator, Optional
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
 from google.auth.exceptions import RefreshError
 
 
+_local = threading.local()
+
+FOLDER_MIME = "application/vnd.google-apps.folder"
+
+#: Constant head of every "folder lookup" q string.
+FOLDER_QUERY = f"mimeType='{FOLDER_MIME}' and trashed=false"
+
+
+def drive_q_escape(value) -> str:
+    """Escape a value for use inside a single-quoted Drive ``q`` literal."""
+    return str(value).replace("\\", "\\\\").replace("'", "\\'")
+
+
+#: Below this a single multipart request beats a resumable session's extra
+#: initiation round trip; above it, chunks are large enough to keep the
+#: request count low (resumable chunks must be multiples of 256 KiB).
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def media_upload(fileobj, mimetype: str, size: int) -> MediaIoBaseUpload:
+    """MediaIoBaseUpload for a ``size``-byte stream, resumable only when large."""
+    if size > RESUMABLE_THRESHOLD:
+        return MediaIoBaseUpload(
+            fileobj, mimetype=mimetype, chunksize=UPLOAD_CHUNK_SIZE, resumable=True
+        )
+    return MediaIoBaseUpload(fileobj, mimetype=mimetype, resumable=False)
+
+
+def list_files(service, q: str, fields: str, page_size: int = 1000) -> Iterator[dict]:
+    """
+    Every file matching ``q``, following nextPageToken (a bare files.list
+    stops at the first page). ``fields`` is the per-file field list.
+    """
+    page_token = None
+    while True:
+        result = (
+            service.files()
+            .list(
+                q=q,
+                fields=f"nextPageToken, files({fields})",
+                pageSize=page_size,
+                pageToken=page_token,
+            )
+            .execute()
+        )
+        yield from result.get("files", [])
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return
+
+
+#: Drive accepts at most 100 calls per batch request.
+BATCH_LIMIT = 100
+
+FILE_NAME_CACHE_TTL = 60 * 60
+
+
+def _file_name_cache_key(file_id: str) -> str:
+    return f"drive:file_name:{file_id}"
+
+
+def get_file_names(service, file_ids, default: str = "Unknown File") -> dict:
+    """
+    {file_id: name} for the given files. Names are cached for an hour; the
+    misses are fetched with batch requests (one HTTP round trip per 100 ids).
+    Files that can't be read map to ``default`` and aren't cached.
+    """
+    cache_keys = {fid: _file_name_cache_key(fid) for fid in file_ids}
+    cached = cache.get_many(cache_keys.values())
+    names = {fid: cached[key] for fid, key in cache_keys.items() if key in cached}
+    fetched = {}
+
+    def on_response(request_id, response, exception):
+        if exception is None and response and "name" in response:
+            fetched[request_id] = response["name"]
+
+    missing = [fid for fid in cache_keys if fid not in names]
+    for start in range(0, len(missing), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_response)
+        for file_id in missing[start:start + BATCH_LIMIT]:
+            batch.add(service.files().get(fileId=file_id, fields="id,name"), request_id=file_id)
+        batch.execute()
+
+    if fetched:
+        cache.set_many(
+            {_file_name_cache_key(fid): name for fid, name in fetched.items()},
+            FILE_NAME_CACHE_TTL,
+        )
+        names.update(fetched)
+
+    return {fid: names.get(fid, default) for fid in cache_keys}
+
+
+def create_file(service, body: dict, media_body, fields: str = "id") -> dict:
+    """
+    files().create. A 404 means a parent folder is gone: it is dropped from
+    the folder caches so the next lookup resolves it again, and the error is
+    re-raised.
+    """
+    try:
+        return (
+            service.files()
+            .create(body=body, media_body=media_body, fields=fields)
+            .execute()
+        )
+    except HttpError as e:
+        if e.resp.status == 404:
+            for parent_id in body.get("parents", ()):
+                GoogleDriveFolderService.forget_folder(parent_id)
+        raise
+
+
 # ==============================
 # 🔐 Google Drive Authentication
 # ==============================
@@ -38,8 +158,40 @@ class GoogleDriveAuthService:
 
     @classmethod
     def get_service(cls):
+        """
+        Drive client, built once per thread and reused until the token file
+        changes (reconnect / removal). httplib2 isn't thread-safe, so the
+        client is never shared between threads.
+        """
+        token_file = settings.GOOGLE_TOKEN_FILE
+        try:
+            version = (token_file, os.path.getmtime(token_file))
+        except OSError:
+            version = None  # load_credentials() raises below
+
+        cached = getattr(_local, "service", None)
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1]
+
         creds = cls.load_credentials()
-        return build("drive", "v3", credentials=creds)
+        # Bundled discovery doc: no discovery HTTP fetch / file cache lookup.
+        service = build(
+            "drive", "v3", credentials=creds, cache_discovery=False, static_discovery=True
+        )
+        _local.service = (version, service)
+        return service
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Forget this thread's client and every cached folder id (e.g. after
+        RefreshError): a reconnected token may belong to another account.
+        """
+        from accounts.models import DriveFolderCache
+
+        _local.__dict__.pop("service", None)
+        GoogleDriveFolderService._forget_rows(DriveFolderCache.objects.all())
+        cache.delete(GoogleDriveFolderService.ROOT_FOLDER_CACHE_KEY)
 
 
 # ==============================
@@ -51,9 +203,111 @@ class GoogleDriveFolderService:
     No authentication logic here.
     """
 
+    ROOT_FOLDER = "oer_content"
+    ROOT_FOLDER_CACHE_KEY = "drive:oer_root_id"
+    ROOT_FOLDER_CACHE_TTL = 24 * 60 * 60
+
     def __init__(self, service):
         self.service = service
 
+    def get_oer_root_id(self) -> str:
+        """
+        ID of the oer_content root folder, cached so the lookup (and the
+        create on first use) isn't repeated on every request.
+        """
+        root_id = cache.get(self.ROOT_FOLDER_CACHE_KEY)
+        if root_id is None:
+            root_id = self.get_or_create_folder(self.ROOT_FOLDER)
+            cache.set(self.ROOT_FOLDER_CACHE_KEY, root_id, self.ROOT_FOLDER_CACHE_TTL)
+        return root_id
+
+    def get_category_root_id(self, folder_type: str) -> str:
+        """
+        ID of the settings.GOOGLE_DRIVE_FOLDERS[folder_type] folder under the
+        oer_content root, cached like the root itself.
+        """
+        oer_root_id = self.get_oer_root_id()
+        key = f"drive:category_root:{oer_root_id}:{folder_type}"
+        root_id = cache.get(key)
+        if root_id is None:
+            root_id = self.get_or_create_folder(
+                settings.GOOGLE_DRIVE_FOLDERS[folder_type], oer_root_id
+            )
+            cache.set(key, root_id, self.ROOT_FOLDER_CACHE_TTL)
+        return root_id
+
+    @staticmethod
+    def _folder_cache_key(folder_name: str, parent_id: Optional[str]) -> str:
+        # folder / topic names may contain spaces: hash them into a safe key
+        digest = hashlib.sha1(folder_name.encode("utf-8")).hexdigest()
+        return f"drive:folder:{parent_id or ''}:{digest}"
+
+    @classmethod
+    def _forget_rows(cls, rows) -> None:
+        """
+        Delete the given DriveFolderCache rows, the rows below them, and the
+        Django cache keys (folder, category root, oer root) holding their ids.
+        """
+        from accounts.models import DriveFolderCache
+
+        forgotten = {row[0]: row for row in rows.values_list("pk", "name", "parent_id", "drive_id")}
+        level = [drive_id for *_, drive_id in forgotten.values() if drive_id]
+        while level:
+            children = [
+                row for row in DriveFolderCache.objects.filter(parent_id__in=level)
+                .values_list("pk", "name", "parent_id", "drive_id")
+                if row[0] not in forgotten
+            ]
+            forgotten.update((row[0], row) for row in children)
+            level = [drive_id for *_, drive_id in children if drive_id]
+        if not forgotten:
+            return
+
+        keys = []
+        for _, name, parent_id, _ in forgotten.values():
+            keys.append(cls._folder_cache_key(name, parent_id or None))
+            keys += [
+                f"drive:category_root:{parent_id}:{folder_type}"
+                for folder_type, folder_name in settings.GOOGLE_DRIVE_FOLDERS.items()
+                if folder_name == name
+            ]
+            if name == cls.ROOT_FOLDER and not parent_id:
+                keys.append(cls.ROOT_FOLDER_CACHE_KEY)
+        cache.delete_many(keys)
+        DriveFolderCache.objects.filter(pk__in=list(forgotten)).delete()
+
+    @classmethod
+    def forget_folder(cls, drive_id: str) -> None:
+        """Drop a folder that is gone from Drive (and everything cached under it)."""
+        from accounts.models import DriveFolderCache
+
+        cls._forget_rows(DriveFolderCache.objects.filter(drive_id=drive_id))
+
+    def _dead_folder_ids(self, drive_ids) -> set:
+        """
+        The ids among drive_ids that Drive reports missing (404) or trashed,
+        checked with batch requests. Other errors count as live.
+        """
+        dead = set()
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                if isinstance(exception, HttpError) and exception.resp.status == 404:
+                    dead.add(request_id)
+            elif response.get("trashed"):
+                dead.add(request_id)
+
+        drive_ids = list(drive_ids)
+        for start in range(0, len(drive_ids), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for drive_id in drive_ids[start:start + BATCH_LIMIT]:
+                batch.add(
+                    self.service.files().get(fileId=drive_id, fields="id,trashed"),
+                    request_id=drive_id,
+                )
+            batch.execute()
+        return dead
+
     def get_or_create_folder(
             self,
             folder_name: str,
@@ -61,16 +315,94 @@ class GoogleDriveFolderService:
     ) -> str:
         """
         Returns folder ID. Creates folder if it does not exist.
+
+        Known folders are answered from the Django cache with no Drive call.
+        A DriveFolderCache row is checked against Drive (missing or trashed
+        folders are forgotten) before it is cached again. On a miss the
+        cache row is inserted first, so a concurrent caller blocks on the
+        unique (name, parent) key until this one commits instead of
+        creating a duplicate folder.
         """
+        from accounts.models import DriveFolderCache
+
+        cache_key = self._folder_cache_key(folder_name, parent_id)
+        drive_id = cache.get(cache_key)
+        if drive_id:
+            return drive_id
+
+        key = {"name": folder_name, "parent_id": parent_id or ""}
 
-        query = (
-            "mimeType='application/vnd.google-apps.folder' "
-            f"and name='{folder_name}' "
-            "and trashed=false"
+        drive_id = (
+            DriveFolderCache.objects.filter(**key)
+            .values_list("drive_id", flat=True)
+            .first()
         )
+        if drive_id and self._dead_folder_ids([drive_id]):
+            self.forget_folder(drive_id)
+            drive_id = None
+        if not drive_id:
+            with transaction.atomic():
+                row, _ = DriveFolderCache.objects.select_for_update().get_or_create(**key)
+                if not row.drive_id:
+                    row.drive_id = self._find_or_create_in_drive(folder_name, parent_id)
+                    row.save(update_fields=["drive_id"])
+            drive_id = row.drive_id
+
+        cache.set(cache_key, drive_id, self.ROOT_FOLDER_CACHE_TTL)
+        return drive_id
+
+    def get_or_create_folders(self, folders) -> list:
+        """
+        get_or_create_folder for several (folder_name, parent_id) pairs.
+
+        Cached folders cost one get_many, the rest a single DriveFolderCache
+        query whose ids are checked against Drive in one batch; only unknown
+        or dead folders fall through to get_or_create_folder (and Drive).
+        """
+        from accounts.models import DriveFolderCache
+
+        keys = [(name, parent_id or "") for name, parent_id in folders]
+        cache_keys = {key: self._folder_cache_key(*key) for key in keys}
+        cached = cache.get_many(cache_keys.values())
+        known = {key: cached[ck] for key, ck in cache_keys.items() if ck in cached}
+
+        pending = set(keys) - known.keys()
+        if pending:
+            lookup = Q()
+            for name, parent_id in pending:
+                lookup |= Q(name=name, parent_id=parent_id)
+            rows = {
+                (name, parent_id): drive_id
+                for name, parent_id, drive_id in DriveFolderCache.objects.filter(lookup)
+                .exclude(drive_id="")
+                .values_list("name", "parent_id", "drive_id")
+            }
+            dead = self._dead_folder_ids(set(rows.values()))
+            for drive_id in dead:
+                self.forget_folder(drive_id)
+            rows = {key: drive_id for key, drive_id in rows.items() if drive_id not in dead}
+            cache.set_many(
+                {cache_keys[key]: drive_id for key, drive_id in rows.items()},
+                self.ROOT_FOLDER_CACHE_TTL,
+            )
+            known.update(rows)
+
+        ids = []
+        for name, parent_id in keys:
+            if (name, parent_id) not in known:
+                known[(name, parent_id)] = self.get_or_create_folder(name, parent_id or None)
+            ids.append(known[(name, parent_id)])
+        return ids
+
+    def _find_or_create_in_drive(
+            self,
+            folder_name: str,
+            parent_id: Optional[str] = None
+    ) -> str:
+        query = f"{FOLDER_QUERY} and name='{drive_q_escape(folder_name)}'"
 
         if parent_id:
-            query += f" and '{parent_id}' in parents"
+            query += f" and '{drive_q_escape(parent_id)}' in parents"
 
         result = (
             self.service.files()
@@ -88,7 +420,7 @@ class GoogleDriveFolderService:
 
         metadata = {
             "name": folder_name,
-            "mimeType": "application/vnd.google-apps.folder",
+            "mimeType": FOLDER_MIME,
         }
 
         if parent_id:
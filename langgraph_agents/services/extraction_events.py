@@ -0,0 +1,36 @@
+# services/extraction_events.py
+"""
+In-process wake-up between the background extraction thread and the
+evaluation thread of the same submission.
+
+Both threads are started by SubmissionOrchestrator in the same process, so a
+threading.Event per upload replaces polling ContentCheck.extraction_status.
+The event is created by whichever side gets there first, so a signal sent
+before the waiter arrives is not lost.
+"""
+import asyncio
+import threading
+from typing import Dict
+
+_events: Dict[int, threading.Event] = {}
+_lock = threading.Lock()
+
+
+def _event_for(upload_id: int) -> threading.Event:
+    with _lock:
+        return _events.setdefault(int(upload_id), threading.Event())
+
+
+def mark_extraction_done(upload_id: int) -> None:
+    """Called by the extractor once extraction_status is committed."""
+    _event_for(upload_id).set()
+
+
+async def wait_for_extraction_done(upload_id: int, timeout: float) -> bool:
+    """True once mark_extraction_done(upload_id) has run, False on timeout."""
+    event = _event_for(upload_id)
+    try:
+        return await asyncio.to_thread(event.wait, timeout)
+    finally:
+        with _lock:
+            _events.pop(int(upload_id), None)
@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'oer.settings')
 
 application = get_asgi_application()
+
+# warm the chat embedding model in server processes only; management
+# commands and the MCP subprocesses never import this module
+from accounts.services import embeddings  # noqa: E402
+
+embeddings.preload_in_background()
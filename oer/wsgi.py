@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'oer.settings')
 
 application = get_wsgi_application()
+
+# warm the chat embedding model in server processes only; management
+# commands and the MCP subprocesses never import this module
+from accounts.services import embeddings  # noqa: E402
+
+embeddings.preload_in_background()